@@ -40,7 +40,13 @@ from .types import (
 )
 
 from .constraints import (
+    ValidationResult,
+    ConstraintSpecification,
+    Constraint,
+    KeyConstraintSpecification,
     KeyConstraint,
+    CardinalityConstraintSpecification,
+    CardinalityConstraint,
 )
 
 __all__ = [
@@ -71,5 +77,11 @@ __all__ = [
     "Graph",
     
     # Constraints
+    "ValidationResult",
+    "ConstraintSpecification",
+    "Constraint",
+    "KeyConstraintSpecification",
     "KeyConstraint",
+    "CardinalityConstraintSpecification",
+    "CardinalityConstraint",
 ]
\ No newline at end of file
@@ -2,7 +2,8 @@
 Catalog management for hierarchical GQL schema organization.
 """
 
-from typing import Dict, Optional
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional
 from .types import GraphType, Graph
 
 
@@ -45,22 +46,72 @@ class Catalog:
         self.catalog_root_config = catalog_root_config
         self.root = Directory("/", "/")
         self.current_path = "/"
+        self._directories: Dict[str, Directory] = {"/": self.root}  # Resolved directories by path
     
     def create_directory(self, path: str) -> Directory:
         """Create a directory in the catalog"""
-        parts = path.strip('/').split('/')
+        parts = [part for part in path.strip('/').split('/') if part]
         current = self.root
-        current_path = ""
         
-        for part in parts:
-            if part:
-                current_path += f"/{part}"
-                if part not in current.children:
-                    current.children[part] = Directory(part, current_path)
-                current = current.children[part]
+        # Each prefix path extends the previous one instead of being rebuilt per segment
+        for part, current_path in zip(parts, accumulate(f"/{part}" for part in parts), strict=True):
+            child = current.children.get(part)
+            if child is None:
+                child = current.children[part] = self._directories[current_path] = Directory(part, current_path)
+            current = child
         
         return current
     
+    def create_directories(self, paths: Iterable[str]) -> List[Directory]:
+        """Create several directories in one pass, returning them in the order given
+        
+        Paths are visited in sorted segment order and the directories along the previous
+        path are kept on a stack, so a prefix shared by several paths is descended only once.
+        """
+        split_paths = [[part for part in path.strip('/').split('/') if part] for path in paths]
+        directories: List[Directory] = [self.root] * len(split_paths)
+        stack = [self.root]
+        previous: List[str] = []
+        
+        for index in sorted(range(len(split_paths)), key=split_paths.__getitem__):
+            parts = split_paths[index]
+            common = 0
+            for previous_part, part in zip(previous, parts, strict=False):  # Compare up to the shorter path
+                if previous_part != part:
+                    break
+                common += 1
+            del stack[common + 1:]
+            
+            current = stack[-1]
+            for part in parts[common:]:
+                child = current.children.get(part)
+                if child is None:
+                    child_path = f"{current.path.rstrip('/')}/{part}"
+                    child = current.children[part] = self._directories[child_path] = Directory(part, child_path)
+                stack.append(child)
+                current = child
+            
+            directories[index] = current
+            previous = parts
+        
+        return directories
+    
+    def resolve(self, path: str) -> Directory:
+        """Return the directory at a path, raising KeyError if it does not exist
+        
+        Directories are indexed by path as they are created or first resolved, so repeated
+        lookups cost one dict probe instead of a walk down the tree.
+        """
+        parts = [part for part in path.strip('/').split('/') if part]
+        key = "/" + "/".join(parts)
+        directory = self._directories.get(key)
+        if directory is None:
+            directory = self.root
+            for part in parts:
+                directory = directory.children[part]
+            self._directories[key] = directory
+        return directory
+    
     def create_gql_schema(self, path: str, name: str) -> GQLSchema:
         """Create a GQL-schema in the specified directory"""
         directory = self.create_directory(path)
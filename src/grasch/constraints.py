@@ -6,90 +6,154 @@ This module defines:
 - Constraint: Runtime instances that validate actual graph values
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Any, Dict, Optional
-from .types import AttributeType, ElementType
+from dataclasses import dataclass
+from typing import List, Any, Dict, Optional, Sequence, Tuple
+from .types import AttributeType, ElementType, ContentRecordType, GraphType, Graph, _intern
 
 
-class ConstraintSpecification(ABC):
+def _find_content_type(graph_context: Any, element_type: str) -> Optional[ContentRecordType]:
+    """Look up the identifying content type of a named element type in a graph or graph type"""
+    graph_type = graph_context.graph_type if isinstance(graph_context, Graph) else graph_context
+    if isinstance(graph_type, GraphType):
+        element = graph_type.node_types.get(element_type) or graph_type.edge_types.get(element_type)
+        if element is not None:
+            return element.identifying_content_type
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class ValidationResult:
+    """Outcome of checking one element against a constraint"""
+    ok: bool
+    missing: Tuple[str, ...] = ()
+
+
+class ConstraintSpecification:
     """Base class for constraint specifications that can be associated with graph types"""
+    __slots__ = ('constraint_type', 'target_elements')
     
     def __init__(self, constraint_type: str, target_elements: List[str]):
         self.constraint_type = constraint_type
         self.target_elements = target_elements
     
-    @abstractmethod
     def create_constraint(self, graph_context: Any) -> 'Constraint':
         """Create a runtime constraint instance for a specific graph"""
-        pass
+        raise NotImplementedError
 
 
-class Constraint(ABC):
+class Constraint:
     """Base class for runtime constraints that validate graph values"""
+    __slots__ = ('specification', 'graph_context')
     
-    def __init__(self, specification: ConstraintSpecification, graph_context: Any):
+    def __init__(self, specification: Optional[ConstraintSpecification], graph_context: Any):
         self.specification = specification
         self.graph_context = graph_context
     
-    @abstractmethod
     def validate(self, element_data: Dict[str, Any]) -> bool:
         """Validate element data against this constraint"""
-        pass
+        raise NotImplementedError
+    
+    def get_error_message(self, element_data: Dict[str, Any], result: Optional[ValidationResult] = None) -> str:
+        """Get error message for constraint violation, reusing a prior check result when given"""
+        raise NotImplementedError
+    
+    def check(self, element_data: Dict[str, Any]) -> ValidationResult:
+        """Validate element data and return the detailed result"""
+        return ValidationResult(self.validate(element_data))
     
-    @abstractmethod
-    def get_error_message(self, element_data: Dict[str, Any]) -> str:
-        """Get error message for constraint violation"""
-        pass
+    def validate_batch(self, labels_column: List[List[str]], properties_column: List[Dict[str, Any]]) -> List[bool]:
+        """Validate elements given as parallel label and property columns"""
+        return [self.validate({'labels': labels, 'properties': properties})
+                for labels, properties in zip(labels_column, properties_column, strict=True)]
+    
+    def _compile_condition(self, namespace: Dict[str, Any], name: str) -> str:
+        """Return a Python expression over element_data that is true when the element is valid
+        
+        The default binds validate into the generated code's namespace under the given name.
+        """
+        namespace[name] = self.validate
+        return f"{name}(element_data)"
 
 
 class KeyConstraintSpecification(ConstraintSpecification):
     """Specification for LEX key constraints on element types"""
+    __slots__ = ('element_type', 'key_attributes', 'content_type')
     
-    def __init__(self, element_type: str, key_attributes: List[str]):
+    def __init__(self, element_type: str, key_attributes: Sequence[str], content_type: Optional[ContentRecordType] = None):
         super().__init__("KEY_CONSTRAINT", [element_type])
         self.element_type = element_type
         self.key_attributes = key_attributes
+        self.content_type = content_type
     
     def create_constraint(self, graph_context: Any) -> 'KeyConstraint':
         """Create a runtime key constraint for a specific graph"""
-        return KeyConstraint(self, graph_context)
+        return KeyConstraint(self.element_type, self.key_attributes, self, graph_context, self.content_type)
 
 
 class KeyConstraint(Constraint):
     """Runtime key constraint that validates element data"""
+    __slots__ = ('element_type', 'key_attributes', '_label_keys', '_property_keys', '_open_keys')
+    
+    def __init__(self, element_type: str, key_attributes: Sequence[str],
+                 specification: Optional[KeyConstraintSpecification] = None, graph_context: Any = None,
+                 content_type: Optional[ContentRecordType] = None):
+        super().__init__(specification, graph_context)
+        self.element_type = element_type
+        self.key_attributes = tuple(map(_intern, key_attributes))
+        
+        # Classify each key attribute once against the element type's content type, so validation
+        # never has to decide per element whether a key is a label or a property
+        if content_type is None:
+            content_type = _find_content_type(graph_context, element_type)
+        label_names = set(content_type.labels) if content_type else set()
+        property_names = {pt.name for pt in content_type.property_types} if content_type else set()
+        self._label_keys = frozenset(k for k in self.key_attributes if k in label_names)
+        self._property_keys = frozenset(k for k in self.key_attributes if k in property_names and k not in label_names)
+        self._open_keys = frozenset(self.key_attributes) - self._label_keys - self._property_keys  # Either kind
+    
+    def _missing(self, labels: List[str], properties: Dict[str, Any]) -> List[str]:
+        """Return the key attributes that are neither labels nor non-null properties"""
+        missing = self._label_keys.difference(labels)
+        if self._property_keys:
+            missing |= {k for k in self._property_keys if properties.get(k) is None}
+        if self._open_keys:
+            missing |= {k for k in self._open_keys.difference(labels) if properties.get(k) is None}
+        if not missing:
+            return []
+        return [key_attr for key_attr in self.key_attributes if key_attr in missing]
+    
+    def _compile_condition(self, namespace: Dict[str, Any], name: str) -> str:
+        """Return the key checks as an expression over label_set and properties with literal names"""
+        checks = [f"{k!r} in label_set" for k in self.key_attributes if k in self._label_keys]
+        checks += [f"properties.get({k!r}) is not None" for k in self.key_attributes if k in self._property_keys]
+        checks += [f"({k!r} in label_set or properties.get({k!r}) is not None)"
+                   for k in self.key_attributes if k in self._open_keys]
+        return " and ".join(checks) or "True"
     
     def validate(self, element_data: Dict[str, Any]) -> bool:
         """Validate that all key attributes are present and not null"""
-        labels = element_data.get('labels', [])
-        properties = element_data.get('properties', {})
-        
-        # Check that all key attributes are present
-        for key_attr in self.specification.key_attributes:
-            # Key attributes can be labels or properties
-            if key_attr in labels:
-                continue
-            elif key_attr in properties and properties[key_attr] is not None:
-                continue
-            else:
-                return False
-        
-        return True
+        return not self._missing(element_data.get('labels', ()), element_data.get('properties', {}))
     
-    def get_error_message(self, element_data: Dict[str, Any]) -> str:
+    def validate_batch(self, labels_column: List[List[str]], properties_column: List[Dict[str, Any]]) -> List[bool]:
+        """Validate elements given as parallel label and property columns without building records"""
+        missing = self._missing
+        return [not missing(labels, properties) for labels, properties in zip(labels_column, properties_column, strict=True)]
+    
+    def check(self, element_data: Dict[str, Any]) -> ValidationResult:
+        """Validate element data and report the missing key attributes"""
+        missing = self._missing(element_data.get('labels', ()), element_data.get('properties', {}))
+        return ValidationResult(not missing, tuple(missing))
+    
+    def get_error_message(self, element_data: Dict[str, Any], result: Optional[ValidationResult] = None) -> str:
         """Get error message for key constraint violation"""
-        missing_attrs = []
-        labels = element_data.get('labels', [])
-        properties = element_data.get('properties', {})
-        
-        for key_attr in self.specification.key_attributes:
-            if key_attr not in labels and (key_attr not in properties or properties[key_attr] is None):
-                missing_attrs.append(key_attr)
-        
-        return f"Key constraint violation on {self.specification.element_type}: missing key attributes {missing_attrs}"
+        if result is None:
+            result = self.check(element_data)
+        return f"Key constraint violation on {self.element_type}: missing key attributes {list(result.missing)}"
 
 
 class CardinalityConstraintSpecification(ConstraintSpecification):
     """Specification for LEX cardinality constraints on relationships"""
+    __slots__ = ('relationship_type', 'min_cardinality', 'max_cardinality')
     
     def __init__(self, relationship_type: str, min_cardinality: int, max_cardinality: Optional[int] = None):
         super().__init__("CARDINALITY_CONSTRAINT", [relationship_type])
@@ -104,6 +168,12 @@ class CardinalityConstraintSpecification(ConstraintSpecification):
 
 class CardinalityConstraint(Constraint):
     """Runtime cardinality constraint that validates relationship counts"""
+    __slots__ = ()
+    
+    @property
+    def element_type(self) -> str:
+        """Name of the constrained relationship type"""
+        return self.specification.relationship_type
     
     def validate(self, element_data: Dict[str, Any]) -> bool:
         """Validate cardinality constraints (implementation depends on graph context)"""
@@ -111,6 +181,6 @@ class CardinalityConstraint(Constraint):
         # For now, return True as placeholder
         return True
     
-    def get_error_message(self, element_data: Dict[str, Any]) -> str:
+    def get_error_message(self, element_data: Dict[str, Any], result: Optional[ValidationResult] = None) -> str:
         """Get error message for cardinality constraint violation"""
         return f"Cardinality constraint violation on {self.specification.relationship_type}"
\ No newline at end of file
@@ -2,16 +2,29 @@
 Core Grasch session and configuration management.
 """
 
-import os
-import tempfile
-from typing import Dict, Any, Optional
+import io
+import sys
+from collections.abc import Iterator
+from typing import AbstractSet, Any, Mapping, Optional, TextIO
 from dataclasses import dataclass
+from functools import cached_property
 from enum import Enum
 
 from .catalog import Catalog
 from .kuzu_mock import MockKuzuConnection
 
 
+# Queries run by GraschSession.demonstrate_cypher_queries
+_Q_PERSONS = "MATCH (p:Person) RETURN p.name, p.age, p.email"
+_Q_COMPANIES = "MATCH (c:Company) RETURN c.name, c.industry"
+_Q_EMPLOYMENT = "MATCH (p:Person)-[r:WORKS_FOR]->(c:Company) RETURN p.name, r.position, r.start_date, c.name"
+_Q_TECH_EMPLOYMENT = """
+MATCH (p:Person)-[r:WORKS_FOR]->(c:Company)
+WHERE c.industry = 'Technology'
+RETURN p.name, r.position, c.name
+"""
+
+
 class LanguageLevel(Enum):
     GQL = "gql"
     LEX = "lex"
@@ -51,16 +64,48 @@ class CatalogRootConfiguration:
         return scheme in self.supported_schemes
 
 
-@dataclass
+class _FrozenMapping(Mapping):
+    """Read-only mapping that hashes by its items; nested mappings are frozen the same way"""
+    __slots__ = ('_data',)
+    
+    def __init__(self, mapping: Mapping[str, Any]):
+        self._data = {key: _FrozenMapping(value) if isinstance(value, Mapping) else value
+                      for key, value in mapping.items()}
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __hash__(self) -> int:
+        return hash(frozenset(self._data.items()))
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+
+@dataclass(frozen=True, slots=True)
 class ProfileConfiguration:
-    """Defines a specific GQL/LEX profile"""
+    """Defines a specific GQL/LEX profile
+    
+    The feature set and implementation-defined values are stored in frozen, hashable form,
+    so a profile (and a session configuration holding it) can serve as a cache key.
+    """
     name: str
-    optional_features: set[str]
-    implementation_defined: Dict[str, Any]
+    optional_features: AbstractSet[str]
+    implementation_defined: Mapping[str, Any]
     lex_compatibility: LEXCompatibility
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'optional_features', frozenset(self.optional_features))
+        object.__setattr__(self, 'implementation_defined', _FrozenMapping(self.implementation_defined))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SessionConfiguration:
     """Session-level configuration"""
     profile: ProfileConfiguration
@@ -86,79 +131,108 @@ class GraschSession:
         # Validate catalog root IRI
         if not self.catalog_root_config.validate_iri(config.catalog_root):
             raise ValueError(f"Unsupported IRI scheme in catalog_root: {config.catalog_root}")
-        
-        self.catalog = Catalog(database_path, self.catalog_root_config)
-        self.kuzu_connection = MockKuzuConnection(database_path)
+    
+    def __enter__(self) -> 'GraschSession':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Close the database connection if one was opened"""
+        connection = self.__dict__.pop('kuzu_connection', None)
+        if connection is not None:
+            connection.close()
+    
+    @cached_property
+    def catalog(self) -> Catalog:
+        """Catalog rooted at the session database, created on first access"""
+        return Catalog(self.database_path, self.catalog_root_config)
+    
+    @cached_property
+    def kuzu_connection(self) -> MockKuzuConnection:
+        """Database connection, opened on first access"""
+        return MockKuzuConnection(self.database_path)
     
     def create_catalog_structure(self):
         """Create hierarchical catalog structure"""
         print("Creating catalog structure...")
         
         # Create directories
-        self.catalog.create_directory("/production")
-        self.catalog.create_directory("/production/customer_data")
-        self.catalog.create_directory("/development")
-        self.catalog.create_directory("/development/test_schemas")
+        self.catalog.create_directories([
+            "/production",
+            "/production/customer_data",
+            "/development",
+            "/development/test_schemas",
+        ])
         
         print("✓ Created catalog directories")
     
-    def demonstrate_cypher_queries(self):
-        """Demonstrate querying the graph using Cypher commands"""
-        print("\nDemonstrating Cypher queries...")
-        print("=" * 50)
+    def demonstrate_cypher_queries(self, stream: Optional[TextIO] = None):
+        """Demonstrate querying the graph using Cypher commands
+        
+        Output is buffered and written to stream (default: sys.stdout) in a single write.
+        """
+        out = io.StringIO()
+        emit = out.write
+        emit("\nDemonstrating Cypher queries...\n")
+        emit("=" * 50 + "\n")
+        
+        # The connection echoes each query into the buffer, so it stays in order with the results
         
         # Query 1: Find all persons
-        print("\n1. Find all persons:")
-        query1 = "MATCH (p:Person) RETURN p.name, p.age, p.email"
-        results1 = self.kuzu_connection.execute(query1)
+        emit("\n1. Find all persons:\n")
+        results1 = self.kuzu_connection.execute(_Q_PERSONS, out)
         for result in results1:
-            print(f"   {result}")
+            emit(f"   {dict(result)}\n")
         
         # Query 2: Find all companies
-        print("\n2. Find all companies:")
-        query2 = "MATCH (c:Company) RETURN c.name, c.industry"
-        results2 = self.kuzu_connection.execute(query2)
+        emit("\n2. Find all companies:\n")
+        results2 = self.kuzu_connection.execute(_Q_COMPANIES, out)
         for result in results2:
-            print(f"   {result}")
+            emit(f"   {dict(result)}\n")
         
         # Query 3: Find employment relationships
-        print("\n3. Find employment relationships:")
-        query3 = "MATCH (p:Person)-[r:WORKS_FOR]->(c:Company) RETURN p.name, r.position, r.start_date, c.name"
-        results3 = self.kuzu_connection.execute(query3)
+        emit("\n3. Find employment relationships:\n")
+        results3 = self.kuzu_connection.execute(_Q_EMPLOYMENT, out)
         for result in results3:
-            print(f"   {result}")
+            emit(f"   {dict(result)}\n")
         
         # Query 4: Find people in technology industry
-        print("\n4. Find people working in technology:")
-        query4 = """
-        MATCH (p:Person)-[r:WORKS_FOR]->(c:Company)
-        WHERE c.industry = 'Technology'
-        RETURN p.name, r.position, c.name
-        """
-        results4 = self.kuzu_connection.execute(query4)
+        emit("\n4. Find people working in technology:\n")
+        results4 = self.kuzu_connection.execute(_Q_TECH_EMPLOYMENT, out)
         for result in results4:
-            print(f"   {result}")
-    
-    def demonstrate_spectral_typing(self):
-        """Demonstrate spectral typing and multi-conformance concepts"""
-        print("\nDemonstrating spectral typing concepts...")
-        print("=" * 50)
-        
-        print("\n1. Content Type Conformance:")
-        print("   Content record: (:Person {name:'John Doe'})")
-        print("   Could conform to multiple content types:")
-        print("   - (:Person {name::STRING NOT NULL, age::INTEGER})")
-        print("   - (:Person {name::STRING NOT NULL, age::INTEGER, email::STRING})")
-        print("   - (:Person {name::STRING NOT NULL, department::STRING})")
-        
-        print("\n2. Key Label Disambiguation:")
-        print("   With ALL ELEMENT TYPES KEYED constraint:")
-        print("   - Each content type has a unique key label set")
-        print("   - Eliminates multi-conformance ambiguity")
-        print("   - Person type key: [Person]")
-        print("   - Company type key: [Company]")
-        print("   - WORKS_FOR edge type key: [WORKS_FOR]")
-        
-        print("\n3. Type Key Inheritance:")
-        print("   Node type (Person): TK((Person)) = TK(PersonContent) = [Person]")
-        print("   Edge type (WORKS_FOR): TK((Person)-[WORKS_FOR]->(Company)) = TK(EmploymentContent) = [WORKS_FOR]")
\ No newline at end of file
+            emit(f"   {dict(result)}\n")
+        
+        (stream or sys.stdout).write(out.getvalue())
+    
+    def demonstrate_spectral_typing(self, stream: Optional[TextIO] = None):
+        """Demonstrate spectral typing and multi-conformance concepts
+        
+        Output is buffered and written to stream (default: sys.stdout) in a single write.
+        """
+        out = io.StringIO()
+        emit = out.write
+        emit("\nDemonstrating spectral typing concepts...\n")
+        emit("=" * 50 + "\n")
+        
+        emit("\n1. Content Type Conformance:\n")
+        emit("   Content record: (:Person {name:'John Doe'})\n")
+        emit("   Could conform to multiple content types:\n")
+        emit("   - (:Person {name::STRING NOT NULL, age::INTEGER})\n")
+        emit("   - (:Person {name::STRING NOT NULL, age::INTEGER, email::STRING})\n")
+        emit("   - (:Person {name::STRING NOT NULL, department::STRING})\n")
+        
+        emit("\n2. Key Label Disambiguation:\n")
+        emit("   With ALL ELEMENT TYPES KEYED constraint:\n")
+        emit("   - Each content type has a unique key label set\n")
+        emit("   - Eliminates multi-conformance ambiguity\n")
+        emit("   - Person type key: [Person]\n")
+        emit("   - Company type key: [Company]\n")
+        emit("   - WORKS_FOR edge type key: [WORKS_FOR]\n")
+        
+        emit("\n3. Type Key Inheritance:\n")
+        emit("   Node type (Person): TK((Person)) = TK(PersonContent) = [Person]\n")
+        emit("   Edge type (WORKS_FOR): TK((Person)-[WORKS_FOR]->(Company)) = TK(EmploymentContent) = [WORKS_FOR]\n")
+        
+        (stream or sys.stdout).write(out.getvalue())
@@ -2,7 +2,45 @@
 Mock Kuzu database connection for demonstration purposes.
 """
 
-from typing import List, Dict, Any
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, TextIO, Tuple
+
+
+# Canned query results, built once at import and read-only so they can be shared by the cache
+_PERSON_RESULTS: Tuple[Mapping[str, Any], ...] = (
+    MappingProxyType({"p.name": "Alice Johnson", "p.age": 30, "p.email": "alice@example.com"}),
+    MappingProxyType({"p.name": "Bob Smith", "p.age": 25, "p.email": "bob@example.com"}),
+)
+
+_COMPANY_RESULTS: Tuple[Mapping[str, Any], ...] = (
+    MappingProxyType({"c.name": "TechCorp", "c.industry": "Technology"}),
+    MappingProxyType({"c.name": "DataSystems", "c.industry": "Software"}),
+)
+
+_EMPLOYMENT_RESULTS: Tuple[Mapping[str, Any], ...] = (
+    MappingProxyType({"p.name": "Alice Johnson", "r.position": "Engineer", "r.start_date": "2020-01-15", "c.name": "TechCorp"}),
+    MappingProxyType({"p.name": "Bob Smith", "r.position": "Analyst", "r.start_date": "2021-03-01", "c.name": "DataSystems"}),
+)
+
+
+# Query patterns mapped to their results; longer patterns come first so they win at the same position
+_QUERY_RESULTS: Dict[str, Tuple[Mapping[str, Any], ...]] = {
+    "MATCH (p:Person)-[r:WORKS_FOR]->(c:Company)": _EMPLOYMENT_RESULTS,
+    "MATCH (c:Company)": _COMPANY_RESULTS,
+    "MATCH (p:Person)": _PERSON_RESULTS,
+}
+
+# Single alternation matched in one C-level scan of the query text
+_QUERY_PATTERN = re.compile("|".join(map(re.escape, _QUERY_RESULTS)))
+
+
+@lru_cache(maxsize=128)
+def _execute_cached(normalized_query: str) -> Tuple[Mapping[str, Any], ...]:
+    """Resolve a whitespace-normalized query to its canned result"""
+    match = _QUERY_PATTERN.search(normalized_query)
+    return _QUERY_RESULTS[match.group()] if match else ()
 
 
 class MockKuzuConnection:
@@ -12,25 +50,16 @@ class MockKuzuConnection:
         self.nodes = []
         self.edges = []
     
-    def execute(self, query: str) -> List[Dict[str, Any]]:
-        """Execute a Cypher query (simplified mock implementation)"""
-        print(f"Executing Cypher query: {query}")
+    def execute(self, query: str, stream: Optional[TextIO] = None) -> Tuple[Mapping[str, Any], ...]:
+        """Execute a Cypher query (simplified mock implementation)
         
-        # Mock query results for demonstration
-        if "MATCH (p:Person)" in query:
-            return [
-                {"p.name": "Alice Johnson", "p.age": 30, "p.email": "alice@example.com"},
-                {"p.name": "Bob Smith", "p.age": 25, "p.email": "bob@example.com"}
-            ]
-        elif "MATCH (c:Company)" in query:
-            return [
-                {"c.name": "TechCorp", "c.industry": "Technology"},
-                {"c.name": "DataSystems", "c.industry": "Software"}
-            ]
-        elif "MATCH (p:Person)-[r:WORKS_FOR]->(c:Company)" in query:
-            return [
-                {"p.name": "Alice Johnson", "r.position": "Engineer", "r.start_date": "2020-01-15", "c.name": "TechCorp"},
-                {"p.name": "Bob Smith", "r.position": "Analyst", "r.start_date": "2021-03-01", "c.name": "DataSystems"}
-            ]
-        else:
-            return []
\ No newline at end of file
+        The query is echoed to stream (default: sys.stdout). Results are read-only mappings
+        shared between calls with the same query text.
+        """
+        print(f"Executing Cypher query: {query}", file=stream)
+        return _execute_cached(" ".join(query.split()))
+    
+    def close(self):
+        """Close the connection (releases the mock's in-memory state)"""
+        self.nodes.clear()
+        self.edges.clear()
@@ -2,38 +2,159 @@
 Type system for content record types, element types, and graph types.
 """
 
-from typing import List, Dict, Any, Optional
-from abc import ABC, abstractmethod
-from enum import Enum
-import uuid
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, List, Dict, Any, Callable, Iterable, Mapping, Optional, Tuple
+from array import array
+from dataclasses import dataclass, field
+import itertools
+import operator
+import sys
+
+if TYPE_CHECKING:
+    from .constraints import Constraint, KeyConstraint
+
+
+__all__ = [
+    "LABEL_DATATYPE",
+    "AttributeType",
+    "LabelType",
+    "PropertyType",
+    "ContentRecordType",
+    "ContentRecordTypeBuilder",
+    "ElementType",
+    "NodeType",
+    "NodeTypeBuilder",
+    "EdgeDirection",
+    "EdgeType",
+    "GraphType",
+    "Graph",
+]
+
+
+# Constant datatype shared by all label types
+LABEL_DATATYPE = sys.intern("LABEL_DATATYPE")
+
+
+def _intern(name: Any) -> Any:
+    """Intern a name if it is a plain str; other values (non-str keys, str subclasses) pass through"""
+    return sys.intern(name) if type(name) is str else name
+
+
+def _intern_labels(labels: Iterable[Any]) -> List[Any]:
+    """Build a stored label row with interned label names"""
+    return [_intern(label) for label in labels]
+
+
+def _intern_properties(properties: Mapping[Any, Any]) -> Dict[Any, Any]:
+    """Build a stored property row with interned property keys"""
+    return {_intern(key): value for key, value in properties.items()}
 
 
 class AttributeType:
     """Base class for label types and property types"""
+    __slots__ = ('name', 'datatype')
+    
     def __init__(self, name: str, datatype: str):
         self.name = name
         self.datatype = datatype
 
 
 class LabelType(AttributeType):
-    """Label type with constant label datatype"""
+    """Label type with constant label datatype
+    
+    Label types are value objects identified by name, so instances are interned:
+    constructing a label type with a name already in use returns the existing instance.
+    Each class interns its own instances, and copies and unpickled label types resolve
+    through the same table.
+    """
+    __slots__ = ()
+    _instances: Dict[Tuple[type, str], 'LabelType'] = {}
+    
+    def __new__(cls, name: str):
+        key = (cls, name)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls._instances.setdefault(key, super().__new__(cls))
+        return instance
+    
     def __init__(self, name: str):
-        super().__init__(name, "LABEL_DATATYPE")
+        super().__init__(name, LABEL_DATATYPE)
+    
+    def __getnewargs__(self) -> Tuple[str]:
+        return (self.name,)
+    
+    @classmethod
+    def of(cls, name: str) -> 'LabelType':
+        """Return the shared label type for a name"""
+        return cls(name)
 
 
 class PropertyType(AttributeType):
     """Property type with GQL datatypes"""
+    __slots__ = ('not_null',)
+    
     def __init__(self, name: str, datatype: str, not_null: bool = False):
         super().__init__(name, datatype)
         self.not_null = not_null
 
 
 class ContentRecordType:
-    """Hierarchical record structure with label types and property structure"""
+    """Hierarchical record structure with label types and property structure
+    
+    Record types compare and hash by structure. The hash is computed once at construction
+    and covers each property type's name, datatype and not_null, so a PropertyType must
+    not be changed once a record type holding it is in use as a key.
+    """
+    __slots__ = ('label_types', 'property_types', '_type_identifier', '_type_key_set', '_type_key', '_label_names',
+                 '_hash')
+    
     def __init__(self, label_types: List[LabelType], property_types: List[PropertyType], type_identifier: Optional[List[str]] = None):
-        self.label_types = tuple(label_types)  # Make immutable tuple
-        self.property_types = tuple(property_types)  # Make immutable tuple
-        self._type_identifier = tuple(type_identifier) if type_identifier else tuple()
+        self._set_parts(
+            tuple(label_types),  # Make immutable tuple
+            tuple(property_types),  # Make immutable tuple
+            tuple(type_identifier) if type_identifier else tuple()
+        )
+    
+    @classmethod
+    def _from_parts(cls, label_types: Tuple[LabelType, ...], property_types: Tuple[PropertyType, ...],
+                    type_identifier: Tuple[str, ...]) -> 'ContentRecordType':
+        """Build from tuples the caller has already frozen, skipping argument normalization"""
+        record_type = cls.__new__(cls)
+        record_type._set_parts(label_types, property_types, type_identifier)
+        return record_type
+    
+    def _set_parts(self, label_types: Tuple[LabelType, ...], property_types: Tuple[PropertyType, ...],
+                   type_identifier: Tuple[str, ...]):
+        self.label_types = label_types
+        self.property_types = property_types
+        self._type_identifier = type_identifier
+        self._type_key_set = frozenset(self._type_identifier)  # For conformance checks
+        # The record type is immutable, so derived views are built once here
+        self._type_key = tuple(LabelType.of(label_id) for label_id in self._type_identifier) if self._type_identifier else None
+        self._label_names = tuple(label.name for label in self.label_types)
+        self._hash = hash(self._signature())  # Record types are used as dict keys; hash once
+    
+    def _signature(self) -> Tuple[Any, ...]:
+        """Return the structural value the record type is compared and hashed by"""
+        return (self._label_names,
+                tuple((pt.name, pt.datatype, pt.not_null) for pt in self.property_types),
+                self._type_identifier)
+    
+    def __hash__(self) -> int:
+        return self._hash
+    
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, ContentRecordType):
+            return NotImplemented
+        return self._signature() == other._signature()
+    
+    def __reduce__(self):
+        # Rebuild on load: str hashes depend on the process's hash seed, so the cached hash is not saved
+        return type(self)._from_parts, (self.label_types, self.property_types, self._type_identifier)
     
     @property
     def name(self) -> Optional[str]:
@@ -43,21 +164,28 @@ class ContentRecordType:
         return None
     
     @property
-    def identifier(self) -> List[str]:
-        """Return the type identifier as a list of label identifiers"""
-        return list(self._type_identifier)
+    def identifier(self) -> Tuple[str, ...]:
+        """Return the type identifier as a tuple of label identifiers"""
+        return self._type_identifier
     
     @property
-    def type_key(self) -> Optional[List[LabelType]]:
+    def type_key(self) -> Optional[Tuple[LabelType, ...]]:
         """Backward compatibility: return LabelType objects for the type identifier"""
-        if self._type_identifier:
-            return [LabelType(label_id) for label_id in self._type_identifier]
-        return None
+        return self._type_key
     
     @property
-    def labels(self) -> List[str]:
+    def labels(self) -> Tuple[str, ...]:
         """Return the label names as strings"""
-        return [label.name for label in self.label_types]
+        return self._label_names
+    
+    @property
+    def type_key_set(self) -> frozenset:
+        """Return the type identifier as a frozenset of label identifiers"""
+        return self._type_key_set
+    
+    def conforms(self, labels: Iterable[str]) -> bool:
+        """Check whether a record with the given labels carries this type's key labels"""
+        return self._type_key_set.issubset(labels)
 
 
 class ContentRecordTypeBuilder:
@@ -79,12 +207,11 @@ class ContentRecordTypeBuilder:
     
     def add_label(self, label: str) -> 'ContentRecordTypeBuilder':
         """Add a label (convenience method that creates LabelType) and return self for chaining"""
-        return self.add_label_type(LabelType(label))
+        return self.add_label_type(LabelType.of(label))
     
     def add_labels(self, labels: List[str]) -> 'ContentRecordTypeBuilder':
         """Add multiple labels (convenience method that creates LabelTypes) and return self for chaining"""
-        for label in labels:
-            self.add_label_type(LabelType(label))
+        self._label_types.extend(map(LabelType.of, labels))
         return self
     
     def add_property_type(self, property_type: PropertyType) -> 'ContentRecordTypeBuilder':
@@ -116,36 +243,50 @@ class ContentRecordTypeBuilder:
     
     def create(self) -> ContentRecordType:
         """Create and return the ContentRecordType instance"""
-        return ContentRecordType(self._label_types, self._property_types, self._type_identifier)
+        return ContentRecordType._from_parts(
+            tuple(self._label_types),
+            tuple(self._property_types),
+            tuple(self._type_identifier) if self._type_identifier else tuple()
+        )
 
 
 # Alias for clarity in ElementType context
 RecordContentType = ContentRecordType
 
 
-class ElementType(ABC):
-    """Abstract base class for all element types (nodes and edges)"""
-    def __init__(self, name: str, identifying_content_type: ContentRecordType):
-        self.element_id = str(uuid.uuid4())  # System-generated UUID
+# Source of element type ids
+_ELEMENT_IDS = itertools.count()
+
+
+class ElementType:
+    """Base class for all element types (nodes and edges)"""
+    __slots__ = ('element_id', 'name', 'identifying_content_type', 'element_kind')
+    
+    def __init__(self, name: str, identifying_content_type: ContentRecordType, element_kind: str):
+        self.element_id = next(_ELEMENT_IDS)  # System-generated, unique within the process
         self.name = name
         self.identifying_content_type = identifying_content_type
+        self.element_kind = element_kind  # "node" or "edge"
     
-    @abstractmethod
     def get_element_kind(self) -> str:
-        """Return the kind of element (node or edge)"""
-        pass
+        """Return the kind of element (node or edge); prefer reading element_kind directly"""
+        return self.element_kind
+    
+    @property
+    def element_id_str(self) -> str:
+        """Return the element id in string form"""
+        return f"elt-{self.element_id}"
 
 
 class NodeType(ElementType):
     """Node type based on content record type"""
+    __slots__ = ('content_type',)
+    
     def __init__(self, content_type: ContentRecordType):
         # NodeType name is derived from content type pseudo-name, or first identifier if available
         node_name = content_type.name or (content_type.identifier[0] if content_type.identifier else "UnnamedNode")
-        super().__init__(node_name, content_type)
+        super().__init__(node_name, content_type, "node")
         self.content_type = content_type  # Keep for backward compatibility
-    
-    def get_element_kind(self) -> str:
-        return "node"
 
 
 class NodeTypeBuilder:
@@ -158,143 +299,395 @@ class NodeTypeBuilder:
         return NodeType(self.content_type)
 
 
+# Bit encoding of the endpoint references used by EdgeDirection
+_REFERENCE_BITS = {"first": 0, "second": 1}
+
+
+@dataclass(frozen=True, slots=True)
 class EdgeDirection:
-    """Direction specification as an ordered pair (tail_reference, head_reference)"""
-    def __init__(self, tail_reference: str, head_reference: str):
-        """
-        Create a direction specification.
-        
-        Args:
-            tail_reference: Either "first" or "second" - which endpoint is the tail
-            head_reference: Either "first" or "second" - which endpoint is the head
-        """
-        if tail_reference not in ("first", "second"):
+    """Direction specification as an ordered pair (tail_reference, head_reference)
+    
+    Attributes:
+        tail_reference: Either "first" or "second" - which endpoint is the tail
+        head_reference: Either "first" or "second" - which endpoint is the head
+    """
+    tail_reference: str
+    head_reference: str
+    # Both references packed as bits: tail in bit 1, head in bit 0 (0 = first, 1 = second)
+    _state: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # The bit lookup doubles as validation: unknown references are absent from the table
+        tail_bit = _REFERENCE_BITS.get(self.tail_reference)
+        if tail_bit is None:
             raise ValueError("tail_reference must be 'first' or 'second'")
-        if head_reference not in ("first", "second"):
+        head_bit = _REFERENCE_BITS.get(self.head_reference)
+        if head_bit is None:
             raise ValueError("head_reference must be 'first' or 'second'")
-        
-        self.tail_reference = tail_reference
-        self.head_reference = head_reference
+        object.__setattr__(self, '_state', (tail_bit << 1) | head_bit)
+    
+    @property
+    def tail_index(self) -> int:
+        """Index of the tail endpoint in (first, second)"""
+        return self._state >> 1
+    
+    @property
+    def head_index(self) -> int:
+        """Index of the head endpoint in (first, second)"""
+        return self._state & 1
     
     def __repr__(self):
         return f"EdgeDirection(tail={self.tail_reference}, head={self.head_reference})"
     
+    @classmethod
+    def of(cls, tail_reference: str, head_reference: str) -> 'EdgeDirection':
+        """Return the shared instance for a direction, validating unknown references"""
+        direction = _EDGE_DIRECTIONS.get((tail_reference, head_reference))
+        return direction if direction is not None else cls(tail_reference, head_reference)
+    
     @classmethod
     def first_to_second(cls):
         """Convenience method: direction from first node to second node"""
-        return cls("first", "second")
+        return cls.of("first", "second")
     
     @classmethod
     def second_to_first(cls):
         """Convenience method: direction from second node to first node"""
-        return cls("second", "first")
+        return cls.of("second", "first")
+
+
+# Shared instances for every valid (tail_reference, head_reference) pair
+_EDGE_DIRECTIONS = {
+    (tail, head): EdgeDirection(tail, head)
+    for tail in ("first", "second")
+    for head in ("first", "second")
+}
 
 
 class EdgeType(ElementType):
     """Edge type with endpoint node types, direction, and arc content type"""
+    __slots__ = ('first_node_type', 'second_node_type', 'arc_content_type', 'direction',
+                 'is_directed', 'is_undirected', '_tail_node_type', '_head_node_type', '_source_type', '_target_type')
+    
     def __init__(self, name: str, first_node_type: NodeType, second_node_type: NodeType, 
                  arc_content_type: ContentRecordType, direction: Optional[EdgeDirection] = None):
-        super().__init__(name, arc_content_type)
+        super().__init__(name, arc_content_type, "edge")
         self.first_node_type = first_node_type
         self.second_node_type = second_node_type
         self.arc_content_type = arc_content_type  # Keep for backward compatibility
         self.direction = direction
-    
-    def get_element_kind(self) -> str:
-        return "edge"
-    
-    @property
-    def is_directed(self) -> bool:
-        """Check if the edge type has a direction specified"""
-        return self.direction is not None
-    
-    @property
-    def is_undirected(self) -> bool:
-        """Check if the edge type has no direction specified"""
-        return self.direction is None
+        self.is_directed = direction is not None  # Whether the edge type has a direction specified
+        self.is_undirected = direction is None
+        
+        # Resolve the endpoints once; the accessors below are hit in traversal loops
+        if direction is None:
+            self._tail_node_type = self._head_node_type = None
+            self._source_type, self._target_type = first_node_type, second_node_type
+        else:
+            endpoints = (first_node_type, second_node_type)
+            self._tail_node_type = endpoints[direction.tail_index]
+            self._head_node_type = endpoints[direction.head_index]
+            self._source_type, self._target_type = self._tail_node_type, self._head_node_type
     
     @property
     def tail_node_type(self) -> Optional[NodeType]:
         """Get the tail (source) node type for directed edges, None for undirected"""
-        if not self.is_directed:
-            return None
-        
-        if self.direction.tail_reference == "first":
-            return self.first_node_type
-        else:
-            return self.second_node_type
+        return self._tail_node_type
     
     @property
     def head_node_type(self) -> Optional[NodeType]:
         """Get the head (target) node type for directed edges, None for undirected"""
-        if not self.is_directed:
-            return None
-        
-        if self.direction.head_reference == "first":
-            return self.first_node_type
-        else:
-            return self.second_node_type
+        return self._head_node_type
     
     @property
     def source_type(self) -> NodeType:
         """Backward compatibility property - maps to tail for directed edges, first for undirected"""
-        if self.is_directed:
-            return self.tail_node_type
-        return self.first_node_type
+        return self._source_type
     
     @property
     def target_type(self) -> NodeType:
         """Backward compatibility property - maps to head for directed edges, second for undirected"""
-        if self.is_directed:
-            return self.head_node_type
-        return self.second_node_type
+        return self._target_type
 
 
 class GraphType:
     """GQL graph type with LEX constraint extensions"""
+    __slots__ = ('name', 'node_types', 'edge_types', '_constraints', 'all_element_types_keyed', '_validator',
+                 '_constraint_element_types')
+    
     def __init__(self, name: str, all_element_types_keyed: bool = False):
         self.name = name
-        self.node_types: List[NodeType] = []
-        self.edge_types: List[EdgeType] = []
-        self.constraints: List['KeyConstraint'] = []
+        self.node_types: Dict[str, NodeType] = {}
+        self.edge_types: Dict[str, EdgeType] = {}
+        self._constraints: Tuple['KeyConstraint', ...] = ()  # Only changed through add_constraint(s)
         self.all_element_types_keyed = all_element_types_keyed
+        self._validator: Optional[Callable[[Dict[str, Any]], bool]] = None
+        self._constraint_element_types: Optional[frozenset] = None  # Rebuilt after constraints change
+    
+    @property
+    def node_types_list(self) -> List[NodeType]:
+        """Node types in insertion order"""
+        return list(self.node_types.values())
+    
+    @property
+    def edge_types_list(self) -> List[EdgeType]:
+        """Edge types in insertion order"""
+        return list(self.edge_types.values())
     
     def add_node_type(self, node_type: NodeType):
-        self.node_types.append(node_type)
+        if node_type.name in self.node_types:
+            raise ValueError(f"Graph type {self.name} already has a node type named {node_type.name!r}")
+        self.node_types[node_type.name] = node_type
+        self._validator = None
     
     def add_edge_type(self, edge_type: EdgeType):
-        self.edge_types.append(edge_type)
+        if edge_type.name in self.edge_types:
+            raise ValueError(f"Graph type {self.name} already has an edge type named {edge_type.name!r}")
+        self.edge_types[edge_type.name] = edge_type
+        self._validator = None
+    
+    @property
+    def constraints(self) -> Tuple['KeyConstraint', ...]:
+        """Constraints in insertion order; read-only so the compiled validator cannot go stale"""
+        return self._constraints
     
     def add_constraint(self, constraint: 'KeyConstraint'):
-        self.constraints.append(constraint)
+        self._constraints += (constraint,)
+        self._validator = None
+        self._constraint_element_types = None
+    
+    def add_constraints(self, constraints: Iterable['KeyConstraint']):
+        """Add several constraints in one call"""
+        self._constraints += tuple(constraints)
+        self._validator = None
+        self._constraint_element_types = None
+    
+    @property
+    def constraint_element_types(self) -> frozenset:
+        """Names of the element types that carry at least one constraint"""
+        if self._constraint_element_types is None:
+            self._constraint_element_types = frozenset(c.element_type for c in self.constraints)
+        return self._constraint_element_types
+    
+    def _type_key_labels(self, element_type_name: str) -> Tuple[str, ...]:
+        """Labels identifying elements of the named element type"""
+        element_type = self.node_types.get(element_type_name) or self.edge_types.get(element_type_name)
+        if element_type is not None and element_type.identifying_content_type.identifier:
+            return element_type.identifying_content_type.identifier
+        return (element_type_name,)
+    
+    def compile_validator(self) -> Callable[[Dict[str, Any]], bool]:
+        """Generate a validator function with every constraint of this graph type unrolled inline
+        
+        Each constraint is checked only for elements carrying its element type's key labels.
+        The attribute names become literals in the generated code, so validating an element
+        does no per-constraint attribute lookups or iteration.
+        """
+        namespace: Dict[str, Any] = {}
+        lines = [
+            "def _validate(element_data):",
+            "    label_set = set(element_data.get('labels', ()))",
+            "    properties = element_data.get('properties', {})",
+        ]
+        for index, constraint in enumerate(self.constraints):
+            applies = " and ".join(f"{label!r} in label_set" for label in self._type_key_labels(constraint.element_type))
+            condition = constraint._compile_condition(namespace, f"_constraint_{index}")
+            lines.append(f"    if {applies} and not ({condition}):")
+            lines.append("        return False")
+        lines.append("    return True")
+        exec("\n".join(lines), namespace)
+        self._validator = namespace["_validate"]
+        return self._validator
+    
+    def validate(self, element_data: Dict[str, Any]) -> bool:
+        """Validate element data against all constraints, compiling the validator on first use"""
+        validator = self._validator or self.compile_validator()
+        return validator(element_data)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # The compiled validator is generated code and cannot be pickled; copies recompile on first use
+        state = {slot: getattr(self, slot) for slot in self.__slots__}
+        state['_validator'] = None
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+
+
+class _RecordView(Sequence):
+    """Read-only sequence of element records built one at a time from a graph's columns
+    
+    The view is not a list: it does not compare equal to one and cannot be appended to.
+    Records share their label and property rows with the graph and must not be mutated.
+    """
+    __slots__ = ('_column', '_get_record')
+    
+    def __init__(self, column: Sequence[Any], get_record: Callable[[int], Dict[str, Any]]):
+        self._column = column
+        self._get_record = get_record
+    
+    def __len__(self) -> int:
+        return len(self._column)
+    
+    def __getitem__(self, index):
+        ids = range(len(self._column))
+        if isinstance(index, slice):
+            return [self._get_record(element_id) for element_id in ids[index]]
+        return self._get_record(ids[index])  # Normalizes negative indices and raises IndexError
 
 
 class Graph:
     """Graph instance conforming to a graph type"""
+    __slots__ = ('name', 'graph_type', '_node_labels', '_node_properties',
+                 '_edge_source_ids', '_edge_target_ids', '_edge_labels', '_edge_properties')
+    
     def __init__(self, name: str, graph_type: GraphType):
         self.name = name
         self.graph_type = graph_type
-        self.nodes: List[Dict[str, Any]] = []
-        self.edges: List[Dict[str, Any]] = []
+        # Elements are stored column-wise: row i of each column belongs to the element with id i
+        self._node_labels: List[List[str]] = []
+        self._node_properties: List[Dict[str, Any]] = []
+        self._edge_source_ids = array('q')  # Endpoint ids packed as 64-bit integers
+        self._edge_target_ids = array('q')
+        self._edge_labels: List[List[str]] = []
+        self._edge_properties: List[Dict[str, Any]] = []
     
-    def insert_node(self, labels: List[str], properties: Dict[str, Any]):
-        """Insert a node with labels and properties"""
-        node = {
-            'labels': labels,
-            'properties': properties,
-            'id': len(self.nodes)
+    @property
+    def nodes(self) -> Sequence[Dict[str, Any]]:
+        """Read-only view of the node records, assembled from the node columns on access"""
+        return _RecordView(self._node_labels, self.get_node)
+    
+    @property
+    def edges(self) -> Sequence[Dict[str, Any]]:
+        """Read-only view of the edge records, assembled from the edge columns on access"""
+        return _RecordView(self._edge_labels, self.get_edge)
+    
+    @property
+    def node_count(self) -> int:
+        """Number of nodes in the graph"""
+        return len(self._node_labels)
+    
+    @property
+    def edge_count(self) -> int:
+        """Number of edges in the graph"""
+        return len(self._edge_labels)
+    
+    def get_node(self, node_id: int) -> Dict[str, Any]:
+        """Return the node with the given id as a record sharing the graph's stored rows (read-only)"""
+        return {
+            'labels': self._node_labels[node_id],
+            'properties': self._node_properties[node_id],
+            'id': node_id
         }
-        self.nodes.append(node)
-        return node['id']
     
-    def insert_edge(self, source_id: int, target_id: int, labels: List[str], properties: Dict[str, Any]):
-        """Insert an edge between nodes"""
-        edge = {
-            'source_id': source_id,
-            'target_id': target_id,
-            'labels': labels,
-            'properties': properties,
-            'id': len(self.edges)
+    def get_edge(self, edge_id: int) -> Dict[str, Any]:
+        """Return the edge with the given id as a record sharing the graph's stored rows (read-only)"""
+        return {
+            'source_id': self._edge_source_ids[edge_id],
+            'target_id': self._edge_target_ids[edge_id],
+            'labels': self._edge_labels[edge_id],
+            'properties': self._edge_properties[edge_id],
+            'id': edge_id
         }
-        self.edges.append(edge)
-        return edge['id']
\ No newline at end of file
+    
+    def insert_node(self, labels: Sequence[str], properties: Mapping[str, Any]):
+        """Insert a node with labels and properties"""
+        # Interned names let label and property-key lookups match on identity
+        node_labels = _intern_labels(labels)
+        node_properties = _intern_properties(properties)
+        
+        node_id = len(self._node_labels)
+        self._node_labels.append(node_labels)
+        self._node_properties.append(node_properties)
+        return node_id
+    
+    def insert_edge(self, source_id: int, target_id: int, labels: Sequence[str], properties: Mapping[str, Any]):
+        """Insert an edge between nodes"""
+        # Build every part of the row before touching a column, so a bad argument cannot leave
+        # the columns with different lengths
+        endpoints = array('q', (operator.index(source_id), operator.index(target_id)))  # Range-checked
+        edge_labels = _intern_labels(labels)
+        edge_properties = _intern_properties(properties)
+        
+        edge_id = len(self._edge_labels)
+        self._edge_source_ids.append(endpoints[0])
+        self._edge_target_ids.append(endpoints[1])
+        self._edge_labels.append(edge_labels)
+        self._edge_properties.append(edge_properties)
+        return edge_id
+    
+    def insert_edges_bulk(self, source_ids: Sequence[int], target_ids: Sequence[int],
+                          labels: Sequence[Sequence[str]], properties: Optional[Sequence[Mapping[str, Any]]] = None) -> range:
+        """Insert many edges given as parallel columns and return the range of their ids
+        
+        Each column is appended in one extend call rather than one insert_edge call per edge.
+        The new rows are built in full first, so a bad value leaves the graph unchanged.
+        """
+        if properties is None:
+            properties = [{} for _ in range(len(labels))]
+        if not len(source_ids) == len(target_ids) == len(labels) == len(properties):
+            raise ValueError("source_ids, target_ids, labels and properties must have the same length")
+        
+        new_source_ids = array('q', map(operator.index, source_ids))
+        new_target_ids = array('q', map(operator.index, target_ids))
+        new_labels = [_intern_labels(edge_labels) for edge_labels in labels]
+        new_properties = [_intern_properties(edge_properties) for edge_properties in properties]
+        
+        first_id = len(self._edge_labels)
+        self._edge_source_ids.extend(new_source_ids)
+        self._edge_target_ids.extend(new_target_ids)
+        self._edge_labels.extend(new_labels)
+        self._edge_properties.extend(new_properties)
+        return range(first_id, len(self._edge_labels))
+    
+    def insert_nodes(self, records: Iterable[Dict[str, Any]]) -> range:
+        """Insert many nodes given as {'labels': ..., 'properties': ...} records and return the range of their ids
+        
+        The new rows are built in full first, so a bad record leaves the graph unchanged.
+        """
+        new_labels = []
+        new_properties = []
+        for record in records:
+            new_labels.append(_intern_labels(record['labels']))
+            new_properties.append(_intern_properties(record.get('properties', {})))
+        
+        first_id = len(self._node_labels)
+        self._node_labels.extend(new_labels)
+        self._node_properties.extend(new_properties)
+        return range(first_id, len(self._node_labels))
+    
+    def insert_edges(self, records: Iterable[Dict[str, Any]]) -> range:
+        """Insert many edges given as {'source_id', 'target_id', 'labels', 'properties'} records
+        
+        The records are split into columns and appended through insert_edges_bulk.
+        """
+        records = list(records)
+        return self.insert_edges_bulk(
+            [record['source_id'] for record in records],
+            [record['target_id'] for record in records],
+            [record['labels'] for record in records],
+            [record.get('properties', {}) for record in records],
+        )
+    
+    def validate_all(self, constraint: 'Constraint') -> List[bool]:
+        """Validate the elements of a constraint's element type in one pass over their columns
+        
+        Edge columns are used when the constraint's element type is an edge type, node columns
+        otherwise. As in the compiled validator, only elements carrying the type's key labels are
+        checked; the result is indexed by element id and reports every other element as valid.
+        """
+        element_type = constraint.element_type
+        if element_type in self.graph_type.edge_types:
+            labels_column, properties_column = self._edge_labels, self._edge_properties
+        else:
+            labels_column, properties_column = self._node_labels, self._node_properties
+        key_labels = self.graph_type._type_key_labels(element_type)
+        in_scope = [element_id for element_id, labels in enumerate(labels_column)
+                    if all(label in labels for label in key_labels)]
+        batch = constraint.validate_batch([labels_column[element_id] for element_id in in_scope],
+                                          [properties_column[element_id] for element_id in in_scope])
+        results = [True] * len(labels_column)
+        for element_id, valid in zip(in_scope, batch, strict=True):
+            results[element_id] = valid
+        return results
@@ -4,35 +4,41 @@ Test script for the updated ElementType hierarchy with new direction model
 """
 
 from src.grasch.types import (
-    ElementType, NodeType, EdgeType, ContentRecordType, 
-    LabelType, PropertyType, EdgeDirection
+    ElementType, NodeType, EdgeType, ContentRecordTypeBuilder, 
+    PropertyType, EdgeDirection
 )
 
 def test_updated_element_type_hierarchy():
     """Test the updated ElementType hierarchy implementation"""
     
     # Create content record types
-    person_content = ContentRecordType("PersonContent")
-    person_content.add_label_type(LabelType("Person"))
-    person_content.add_property_type(PropertyType("name", "STRING", not_null=True))
-    
-    company_content = ContentRecordType("CompanyContent")
-    company_content.add_label_type(LabelType("Company"))
-    company_content.add_property_type(PropertyType("name", "STRING", not_null=True))
-    
-    works_for_content = ContentRecordType("WorksForContent")
-    works_for_content.add_label_type(LabelType("WORKS_FOR"))
-    works_for_content.add_property_type(PropertyType("position", "STRING"))
-    
-    # Create node types
-    person_type = NodeType("Person", person_content)
-    company_type = NodeType("Company", company_content)
+    person_content = ContentRecordTypeBuilder() \
+        .add_label("Person") \
+        .add_property_type(PropertyType("name", "STRING", not_null=True)) \
+        .add_type_name("Person") \
+        .create()
+    
+    company_content = ContentRecordTypeBuilder() \
+        .add_label("Company") \
+        .add_property_type(PropertyType("name", "STRING", not_null=True)) \
+        .add_type_name("Company") \
+        .create()
+    
+    works_for_content = ContentRecordTypeBuilder() \
+        .add_label("WORKS_FOR") \
+        .add_property_type(PropertyType("position", "STRING")) \
+        .add_type_name("WORKS_FOR") \
+        .create()
+    
+    # Create node types (names are derived from the content type names)
+    person_type = NodeType(person_content)
+    company_type = NodeType(company_content)
     
     print("✓ Created NodeType instances")
     
     # Test NodeType inheritance from ElementType
     assert isinstance(person_type, ElementType)
-    assert person_type.get_element_kind() == "node"
+    assert person_type.element_kind == "node"
     assert person_type.identifying_content_type == person_content
     assert person_type.name == "Person"
     
@@ -51,7 +57,7 @@ def test_updated_element_type_hierarchy():
     
     # Test EdgeType inheritance from ElementType
     assert isinstance(first_to_second_edge, ElementType)
-    assert first_to_second_edge.get_element_kind() == "edge"
+    assert first_to_second_edge.element_kind == "edge"
     assert first_to_second_edge.identifying_content_type == works_for_content
     
     print("✓ EdgeType correctly inherits from ElementType")
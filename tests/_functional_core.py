@@ -0,0 +1,287 @@
+"""
+Shared driver for the Grasch functional tests.
+
+Builds the sample employee graph (content types, graph type with LEX key constraints,
+populated graph) and walks the catalog/query workflow. The content and node types can be
+created either directly or through their builders, so the tests can exercise both paths.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+import pathlib
+import sys
+import tempfile
+from types import MappingProxyType
+from typing import Any, Callable
+
+from grasch import (
+    GraschSession,
+    SessionConfiguration,
+    ProfileConfiguration,
+    LanguageLevel,
+    LEXCompatibility,
+    ContentRecordType,
+    ContentRecordTypeBuilder,
+    LabelType,
+    PropertyType,
+    NodeType,
+    NodeTypeBuilder,
+    EdgeType,
+    GraphType,
+    Graph,
+    KeyConstraint,
+)
+
+
+logger = logging.getLogger("grasch.tests")
+logger.addHandler(logging.NullHandler())
+
+
+# Interned names and label tuples shared by the builders and the graph population
+STRING = sys.intern("STRING")
+INTEGER = sys.intern("INTEGER")
+DATE = sys.intern("DATE")
+PERSON = sys.intern("Person")
+COMPANY = sys.intern("Company")
+WORKS_FOR = sys.intern("WORKS_FOR")
+PERSON_LABELS = (PERSON,)
+COMPANY_LABELS = (COMPANY,)
+WF_LABELS = (WORKS_FOR,)
+
+
+# Key constraints on every element type, shared by the graph types built here
+_KEY_CONSTRAINTS = (
+    KeyConstraint(PERSON, PERSON_LABELS),
+    KeyConstraint(COMPANY, COMPANY_LABELS),
+    KeyConstraint(WORKS_FOR, WF_LABELS),
+)
+
+
+# Property maps for the sample data, built once and read-only
+ALICE_PROPS = MappingProxyType({"name": "Alice Johnson", "age": 30, "email": "alice@example.com"})
+BOB_PROPS = MappingProxyType({"name": "Bob Smith", "age": 25, "email": "bob@example.com"})
+TECHCORP_PROPS = MappingProxyType({"name": "TechCorp", "industry": "Technology"})
+DATASYSTEMS_PROPS = MappingProxyType({"name": "DataSystems", "industry": "Software"})
+ALICE_EMPLOYMENT_PROPS = MappingProxyType({"position": "Engineer", "start_date": "2020-01-15"})
+BOB_EMPLOYMENT_PROPS = MappingProxyType({"position": "Analyst", "start_date": "2021-03-01"})
+
+
+# Full profile shared by every session configuration; immutable so it can be built once
+_OPTIONAL_FEATURES = frozenset(("GC04", "GG25", "IL001"))
+_IMPLEMENTATION_DEFINED = MappingProxyType({"IL001": MappingProxyType({"min": 0, "max": None})})
+_FULL_PROFILE = ProfileConfiguration(
+    name="Full Profile",
+    optional_features=_OPTIONAL_FEATURES,
+    implementation_defined=_IMPLEMENTATION_DEFINED,
+    lex_compatibility=LEXCompatibility.FULL
+)
+
+
+# Identical property descriptors are shared; label types are already interned by LabelType itself
+_PropertyType = functools.lru_cache(maxsize=None)(PropertyType)
+
+
+# Construction paths exercised by the tests: (content type factory, node type factory)
+DIRECT_FACTORIES = (ContentRecordType, NodeType)
+BUILDER_FACTORIES = (ContentRecordTypeBuilder, NodeTypeBuilder)
+
+
+def make_session_config() -> SessionConfiguration:
+    """Create a test session configuration"""
+    return SessionConfiguration(
+        profile=_FULL_PROFILE,
+        language_level=LanguageLevel.LEX,
+        catalog_root="file:.",
+        default_catalog_path="/",
+        nested_record_schema_processor_type="JSON Schema",
+        nested_record_schema_processor="default"
+    )
+
+
+def open_session(database_path: str) -> GraschSession:
+    """Open a session on the test configuration and log how it was configured"""
+    session_config = make_session_config()
+    if logger.isEnabledFor(logging.INFO):
+        # Render the enum value and profile name once, and only when they will be logged
+        lang_value = session_config.language_level.value
+        profile_name = session_config.profile.name
+        logger.info("Initializing Grasch session with %s language level...", lang_value)
+        logger.info("Using profile: %s", profile_name)
+        logger.info("Database path: %s", database_path)
+    return GraschSession(session_config, database_path)
+
+
+def _content_type(factory: Callable[..., Any], type_name: str, *property_types: PropertyType) -> ContentRecordType:
+    """Create a single-label content type either directly or through its builder"""
+    if factory is ContentRecordTypeBuilder:
+        builder = factory().add_label(type_name)
+        for property_type in property_types:
+            builder.add_property_type(property_type)
+        return builder.add_type_name(type_name).create()
+    return factory([LabelType(type_name)], list(property_types), [type_name])
+
+
+def _node_type(factory: Callable[[ContentRecordType], Any], content_type: ContentRecordType) -> NodeType:
+    """Create a node type either directly or through its builder"""
+    node_type = factory(content_type)
+    return node_type.create() if isinstance(node_type, NodeTypeBuilder) else node_type
+
+
+@functools.cache
+def build_content_types(factory: Callable[..., Any] = ContentRecordTypeBuilder) -> dict[str, ContentRecordType]:
+    """Define content record types for the graph (built once per factory and process)"""
+    return {
+        "person": _content_type(factory, PERSON,
+                                _PropertyType("name", STRING, not_null=True),
+                                _PropertyType("age", INTEGER),
+                                _PropertyType("email", STRING)),
+        "company": _content_type(factory, COMPANY,
+                                 _PropertyType("name", STRING, not_null=True),
+                                 _PropertyType("industry", STRING)),
+        "employment": _content_type(factory, WORKS_FOR,
+                                    _PropertyType("position", STRING),
+                                    _PropertyType("start_date", DATE)),
+    }
+
+
+def build_schema(content_types: dict[str, ContentRecordType],
+                 node_factory: Callable[[ContentRecordType], Any] = NodeTypeBuilder) -> GraphType:
+    """Create a graph type with ALL ELEMENT TYPES KEYED constraint"""
+    person_node_type = _node_type(node_factory, content_types["person"])
+    company_node_type = _node_type(node_factory, content_types["company"])
+    
+    works_for_edge_type = EdgeType(
+        WORKS_FOR,
+        person_node_type,
+        company_node_type,
+        content_types["employment"]
+    )
+    
+    # Create graph type with ALL ELEMENT TYPES KEYED constraint
+    graph_type = GraphType("EmployeeGraph", all_element_types_keyed=True)
+    graph_type.add_node_type(person_node_type)
+    graph_type.add_node_type(company_node_type)
+    graph_type.add_edge_type(works_for_edge_type)
+    
+    # Add key constraints (required by ALL ELEMENT TYPES KEYED)
+    graph_type.add_constraints(_KEY_CONSTRAINTS)
+    
+    return graph_type
+
+
+def build_graph(graph_type: GraphType) -> Graph:
+    """Create a graph instance and populate it with data"""
+    graph = Graph("employee_data", graph_type)
+    
+    # Insert Person and Company nodes in one batch; ids come back in record order
+    alice_id, bob_id, techcorp_id, datasystems_id = graph.insert_nodes([
+        {"labels": PERSON_LABELS, "properties": ALICE_PROPS},
+        {"labels": PERSON_LABELS, "properties": BOB_PROPS},
+        {"labels": COMPANY_LABELS, "properties": TECHCORP_PROPS},
+        {"labels": COMPANY_LABELS, "properties": DATASYSTEMS_PROPS},
+    ])
+    
+    # Insert WORKS_FOR edges in one batch
+    graph.insert_edges([
+        {"source_id": alice_id, "target_id": techcorp_id, "labels": WF_LABELS, "properties": ALICE_EMPLOYMENT_PROPS},
+        {"source_id": bob_id, "target_id": datasystems_id, "labels": WF_LABELS, "properties": BOB_EMPLOYMENT_PROPS},
+    ])
+    
+    return graph
+
+
+def check_workflow(grasch_session: GraschSession, content_types: dict[str, ContentRecordType],
+                   graph_type: GraphType, graph: Graph, schema_dir: str = "customer_data",
+                   run_demos: bool = True):
+    """Walk the workflow from catalog to queries, verifying each step
+    
+    With run_demos false the query and spectral typing demonstrations are left out.
+    """
+    # Step 1: Create catalog structure
+    logger.info("\n1. Creating catalog structure...")
+    grasch_session.create_catalog_structure()
+    
+    # Verify catalog structure
+    root_children = grasch_session.catalog.root.children
+    assert ("production" in root_children, "development" in root_children) == (True, True)
+    logger.info("   ✓ Catalog directories created successfully")
+    
+    # Step 2: Verify content types
+    logger.info("\n2. Defining content record types...")
+    assert len(content_types) == 3
+    assert {key: (content_type.type_key is not None, content_type.name, content_type.identifier)
+            for key, content_type in content_types.items()} == {
+        "person": (True, "Person", ("Person",)),
+        "company": (True, "Company", ("Company",)),
+        "employment": (True, "WORKS_FOR", ("WORKS_FOR",)),
+    }
+    logger.info("   ✓ Content record types with type identifiers defined")
+    
+    # Step 3: Verify graph type
+    logger.info("\n3. Creating graph type with LEX constraints...")
+    assert (graph_type.all_element_types_keyed, len(graph_type.node_types), len(graph_type.edge_types),
+            len(graph_type.constraints)) == (True, 2, 1, 3)
+    logger.info("   ✓ Graph type with ALL ELEMENT TYPES KEYED constraint created")
+    
+    # Step 4: Verify graph population
+    logger.info("\n4. Creating and populating graph instance...")
+    assert (graph.node_count, graph.edge_count, graph.graph_type is graph_type) == (4, 2, True)
+    logger.info("   ✓ Graph populated with %s nodes and %s edges", graph.node_count, graph.edge_count)
+    
+    # Step 5: Store in catalog
+    logger.info("\n5. Storing objects in catalog...")
+    schema = grasch_session.catalog.create_gql_schema(f"/production/{schema_dir}", "employee_schema")
+    schema.add_graph_type(graph_type)
+    schema.add_graph(graph)
+    
+    # Verify catalog storage
+    stored_dir = grasch_session.catalog.resolve(f"/production/{schema_dir}")
+    assert "employee_schema" in stored_dir.schemas
+    stored_schema = stored_dir.schemas["employee_schema"]
+    assert ("EmployeeGraph" in stored_schema.graph_types, "employee_data" in stored_schema.graphs) == (True, True)
+    logger.info("   ✓ Objects stored in catalog at /production/%s/employee_schema", schema_dir)
+    
+    if run_demos:
+        run_demonstrations(grasch_session)
+
+
+def run_demonstrations(grasch_session: GraschSession):
+    """Run the session's query and spectral typing demonstrations"""
+    # Step 6: Demonstrate queries
+    logger.info("\n6. Demonstrating Cypher queries...")
+    grasch_session.demonstrate_cypher_queries()
+    
+    # Step 7: Demonstrate spectral typing concepts
+    logger.info("\n7. Demonstrating spectral typing concepts...")
+    grasch_session.demonstrate_spectral_typing()
+
+
+def run_functional_test():
+    """Run the complete functional test outside pytest"""
+    logger.info("=" * 60)
+    logger.info("GRASCH LIBRARY FUNCTIONAL TEST")
+    logger.info("=" * 60)
+    
+    # Create temporary database directory
+    with tempfile.TemporaryDirectory() as temp_dir, \
+            open_session(os.fspath(pathlib.Path(temp_dir) / "grasch_test.db")) as grasch_session:
+        content_types = build_content_types()
+        graph_type = build_schema(content_types)
+        graph = build_graph(graph_type)
+        check_workflow(grasch_session, content_types, graph_type, graph)
+        
+        logger.info("\n" + "=" * 60)
+        logger.info("✓ FUNCTIONAL TEST COMPLETED SUCCESSFULLY!")
+        logger.info("✓ All Grasch library features demonstrated")
+        logger.info("✓ Graph data persisted in Kuzu database")
+        logger.info("✓ Cypher queries executed successfully")
+        logger.info("=" * 60)
+
+
+def main():
+    """Entry point for running the functional test as a script"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    run_functional_test()
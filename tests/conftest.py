@@ -0,0 +1,22 @@
+"""
+Shared pytest configuration for the Grasch test suite.
+"""
+
+import logging
+import pathlib
+import tempfile
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _loglevel(caplog):
+    """Keep test progress logging quiet unless a run asks for it"""
+    caplog.set_level(logging.WARNING, logger="grasch.tests")
+
+
+@pytest.fixture(scope="module")
+def base_tmp():
+    """Temporary directory shared by a test module and removed once when the module finishes"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield pathlib.Path(temp_dir)
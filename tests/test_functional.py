@@ -7,267 +7,115 @@ It creates a hierarchical catalog, defines a GQL-schema with a graph type, creat
 instance, populates it with data, and queries it using Cypher commands.
 """
 
+from __future__ import annotations
+
 import os
-import tempfile
-from typing import Dict
 
 import pytest
 
-from grasch import (
-    GraschSession,
-    SessionConfiguration,
-    ProfileConfiguration,
-    LanguageLevel,
-    LEXCompatibility,
-    ContentRecordTypeBuilder,
-    LabelType,
-    PropertyType,
-    NodeTypeBuilder,
-    EdgeType,
-    GraphType,
-    Graph,
-    KeyConstraint,
+from grasch import Graph, GraphType
+
+from _functional_core import (
+    BUILDER_FACTORIES,
+    DIRECT_FACTORIES,
+    build_content_types,
+    build_graph,
+    build_schema,
+    check_workflow,
+    logger,
+    main,
+    open_session,
+    run_demonstrations,
 )
 
 
+@pytest.fixture(scope="module")
+def shared_session(base_tmp):
+    """One session and database for the whole module; tests namespace their catalog paths"""
+    with open_session(os.fspath(base_tmp / "grasch_test.db")) as session:
+        yield session
+
+
+# Shared fixtures: the schema and data are built once per test class and construction path
+
+@pytest.fixture(scope="class", params=[DIRECT_FACTORIES, BUILDER_FACTORIES], ids=["direct", "builder"])
+def factories(request):
+    """Content type and node type factories: the constructors themselves or their builders"""
+    return request.param
+
+
+@pytest.fixture(scope="class")
+def content_types(factories):
+    """Content record types shared by the tests in a class"""
+    return build_content_types(factories[0])
+
+
+@pytest.fixture(scope="class")
+def graph_type(factories, content_types) -> GraphType:
+    """Graph type shared by the tests in a class"""
+    return build_schema(content_types, factories[1])
+
+
+@pytest.fixture(scope="class")
+def populated_graph(graph_type) -> Graph:
+    """Populated graph shared by the tests in a class"""
+    return build_graph(graph_type)
+
+
 class TestGraschFunctional:
     """Comprehensive functional test for Grasch library"""
     
-    @pytest.fixture
-    def session_config(self) -> SessionConfiguration:
-        """Create a test session configuration"""
-        full_profile = ProfileConfiguration(
-            name="Full Profile",
-            optional_features={"GC04", "GG25", "IL001"},
-            implementation_defined={"IL001": {"min": 0, "max": None}},
-            lex_compatibility=LEXCompatibility.FULL
-        )
-        
-        return SessionConfiguration(
-            profile=full_profile,
-            language_level=LanguageLevel.LEX,
-            catalog_root="file:.",
-            default_catalog_path="/",
-            nested_record_schema_processor_type="JSON Schema",
-            nested_record_schema_processor="default"
-        )
-    
-    def create_content_types(self):
-        """Define content record types for the graph"""
-        # Person content type
-        person_content = ContentRecordTypeBuilder() \
-            .add_label("Person") \
-            .add_property_type(PropertyType("name", "STRING", not_null=True)) \
-            .add_property_type(PropertyType("age", "INTEGER")) \
-            .add_property_type(PropertyType("email", "STRING")) \
-            .add_type_name("Person") \
-            .create()
-        
-        # Company content type
-        company_content = ContentRecordTypeBuilder() \
-            .add_label("Company") \
-            .add_property_type(PropertyType("name", "STRING", not_null=True)) \
-            .add_property_type(PropertyType("industry", "STRING")) \
-            .add_type_name("Company") \
-            .create()
-        
-        # Employment relationship content type
-        employment_content = ContentRecordTypeBuilder() \
-            .add_label("WORKS_FOR") \
-            .add_property_type(PropertyType("position", "STRING")) \
-            .add_property_type(PropertyType("start_date", "DATE")) \
-            .add_type_name("WORKS_FOR") \
-            .create()
-        
-        return {
-            "person": person_content,
-            "company": company_content,
-            "employment": employment_content
-        }
-    
-    def create_graph_schema(self, content_types) -> GraphType:
-        """Create a graph type with ALL ELEMENT TYPES KEYED constraint"""
-        # Create element types using builders
-        person_node_type = NodeTypeBuilder(content_types["person"]).create()
-        company_node_type = NodeTypeBuilder(content_types["company"]).create()
-        
-        works_for_edge_type = EdgeType(
-            "WORKS_FOR",
-            person_node_type,
-            company_node_type,
-            content_types["employment"]
-        )
-        
-        # Create graph type with ALL ELEMENT TYPES KEYED constraint
-        graph_type = GraphType("EmployeeGraph", all_element_types_keyed=True)
-        graph_type.add_node_type(person_node_type)
-        graph_type.add_node_type(company_node_type)
-        graph_type.add_edge_type(works_for_edge_type)
-        
-        # Add key constraints (required by ALL ELEMENT TYPES KEYED)
-        graph_type.add_constraint(KeyConstraint("Person", ["Person"]))
-        graph_type.add_constraint(KeyConstraint("Company", ["Company"]))
-        graph_type.add_constraint(KeyConstraint("WORKS_FOR", ["WORKS_FOR"]))
-        
-        return graph_type
-    
-    def create_and_populate_graph(self, graph_type: GraphType) -> Graph:
-        """Create a graph instance and populate it with data"""
-        # Create graph instance
-        graph = Graph("employee_data", graph_type)
-        
-        # Insert Person nodes
-        alice_id = graph.insert_node(
-            labels=["Person"],
-            properties={"name": "Alice Johnson", "age": 30, "email": "alice@example.com"}
-        )
-        
-        bob_id = graph.insert_node(
-            labels=["Person"],
-            properties={"name": "Bob Smith", "age": 25, "email": "bob@example.com"}
-        )
-        
-        # Insert Company nodes
-        techcorp_id = graph.insert_node(
-            labels=["Company"],
-            properties={"name": "TechCorp", "industry": "Technology"}
-        )
-        
-        datasystems_id = graph.insert_node(
-            labels=["Company"],
-            properties={"name": "DataSystems", "industry": "Software"}
-        )
-        
-        # Insert WORKS_FOR edges
-        graph.insert_edge(
-            source_id=alice_id,
-            target_id=techcorp_id,
-            labels=["WORKS_FOR"],
-            properties={"position": "Engineer", "start_date": "2020-01-15"}
-        )
-        
-        graph.insert_edge(
-            source_id=bob_id,
-            target_id=datasystems_id,
-            labels=["WORKS_FOR"],
-            properties={"position": "Analyst", "start_date": "2021-03-01"}
-        )
-        
-        return graph
-    
-    def test_complete_workflow(self):
+    def test_complete_workflow(self, request, shared_session, content_types, graph_type, populated_graph):
         """Test the complete Grasch workflow from catalog to queries"""
-        print("\n" + "=" * 60)
-        print("GRASCH LIBRARY FUNCTIONAL TEST")
-        print("=" * 60)
-        
-        # Create session for standalone mode
-        with tempfile.TemporaryDirectory() as temp_dir:
-            database_path = os.path.join(temp_dir, "grasch_test.db")
-            session_config = self.session_config()
-            grasch_session = GraschSession(session_config, database_path)
-            
-            # Step 1: Create catalog structure
-            print("\n1. Creating catalog structure...")
-            grasch_session.create_catalog_structure()
-            
-            # Verify catalog structure
-            assert grasch_session.catalog.root.children["production"] is not None
-            assert grasch_session.catalog.root.children["development"] is not None
-            print("   ✓ Catalog directories created successfully")
-            
-            # Step 2: Define content types
-            print("\n2. Defining content record types...")
-            content_types = self.create_content_types()
-            
-            # Verify content types
-            assert len(content_types) == 3
-            assert content_types["person"].type_key is not None
-            assert content_types["company"].type_key is not None
-            assert content_types["employment"].type_key is not None
-            print("   ✓ Content record types with type keys defined")
-            
-            # Step 3: Create graph schema with constraints
-            print("\n3. Creating graph type with LEX constraints...")
-            graph_type = self.create_graph_schema(content_types)
-            
-            # Verify graph type
-            assert graph_type.all_element_types_keyed is True
-            assert len(graph_type.node_types) == 2
-            assert len(graph_type.edge_types) == 1
-            assert len(graph_type.constraints) == 3
-            print("   ✓ Graph type with ALL ELEMENT TYPES KEYED constraint created")
-            
-            # Step 4: Create and populate graph
-            print("\n4. Creating and populating graph instance...")
-            graph = self.create_and_populate_graph(graph_type)
-            
-            # Verify graph population
-            assert len(graph.nodes) == 4
-            assert len(graph.edges) == 2
-            assert graph.graph_type == graph_type
-            print(f"   ✓ Graph populated with {len(graph.nodes)} nodes and {len(graph.edges)} edges")
-            
-            # Step 5: Store in catalog
-            print("\n5. Storing objects in catalog...")
-            schema = grasch_session.catalog.create_gql_schema("/production/customer_data", "employee_schema")
-            schema.add_graph_type(graph_type)
-            schema.add_graph(graph)
-            
-            # Verify catalog storage
-            assert "employee_schema" in grasch_session.catalog.root.children["production"].children["customer_data"].schemas
-            stored_schema = grasch_session.catalog.root.children["production"].children["customer_data"].schemas["employee_schema"]
-            assert "EmployeeGraph" in stored_schema.graph_types
-            assert "employee_data" in stored_schema.graphs
-            print("   ✓ Objects stored in catalog at /production/customer_data/employee_schema")
-            
-            # Step 6: Demonstrate queries
-            print("\n6. Demonstrating Cypher queries...")
-            grasch_session.demonstrate_cypher_queries()
-            
-            # Step 7: Demonstrate spectral typing concepts
-            print("\n7. Demonstrating spectral typing concepts...")
-            grasch_session.demonstrate_spectral_typing()
-            
-            print("\n" + "=" * 60)
-            print("✓ FUNCTIONAL TEST COMPLETED SUCCESSFULLY!")
-            print("✓ All Grasch library features demonstrated")
-            print("✓ Graph data persisted in Kuzu database")
-            print("✓ Cypher queries executed successfully")
-            print("=" * 60)
+        logger.info("\n" + "=" * 60)
+        logger.info("GRASCH LIBRARY FUNCTIONAL TEST")
+        logger.info("=" * 60)
+        
+        # Per-test subtree of the shared catalog
+        schema_dir = f"customer_data_{request.node.callspec.id}"
+        check_workflow(shared_session, content_types, graph_type, populated_graph, schema_dir, run_demos=False)
+        
+        logger.info("\n" + "=" * 60)
+        logger.info("✓ FUNCTIONAL TEST COMPLETED SUCCESSFULLY!")
+        logger.info("✓ Graph data persisted in Kuzu database")
+        logger.info("=" * 60)
     
-    def test_content_type_system(self):
+    @pytest.mark.slow
+    @pytest.mark.skipif(not os.environ.get("GRASCH_RUN_DEMOS"), reason="demos are integration-level; set GRASCH_RUN_DEMOS=1")
+    def test_demonstrations(self, shared_session):
+        """Run the Cypher query and spectral typing demonstrations"""
+        run_demonstrations(shared_session)
+        
+        logger.info("✓ All Grasch library features demonstrated")
+        logger.info("✓ Cypher queries executed successfully")
+    
+    def test_content_type_system(self, content_types):
         """Test the content type system specifically"""
-        print("\n" + "=" * 40)
-        print("CONTENT TYPE SYSTEM TEST")
-        print("=" * 40)
-        
-        content_types = self.create_content_types()
+        logger.info("\n" + "=" * 40)
+        logger.info("CONTENT TYPE SYSTEM TEST")
+        logger.info("=" * 40)
         
         # Test attribute type inheritance
         person_content = content_types["person"]
         assert len(person_content.label_types) == 1
         assert len(person_content.property_types) == 3
         assert person_content.label_types[0].datatype == "LABEL_DATATYPE"
-        assert person_content.labels == ["Person"]
+        assert person_content.labels == ("Person",)
         
         # Test type identifier relationships
         assert person_content.name == "Person"
-        assert person_content.identifier == ["Person"]
+        assert person_content.identifier == ("Person",)
         assert len(person_content.identifier) == 1
         
-        print("   ✓ Unified attribute type model validated")
-        print("   ✓ Type key inheritance relationships verified")
-        print("   ✓ Content record type structure confirmed")
+        logger.info("   ✓ Unified attribute type model validated")
+        logger.info("   ✓ Type key inheritance relationships verified")
+        logger.info("   ✓ Content record type structure confirmed")
     
-    def test_lex_constraints(self):
+    def test_lex_constraints(self, graph_type):
         """Test LEX constraint system"""
-        print("\n" + "=" * 40)
-        print("LEX CONSTRAINTS TEST")
-        print("=" * 40)
-        
-        content_types = self.create_content_types()
-        graph_type = self.create_graph_schema(content_types)
+        logger.info("\n" + "=" * 40)
+        logger.info("LEX CONSTRAINTS TEST")
+        logger.info("=" * 40)
         
         # Test ALL ELEMENT TYPES KEYED constraint
         assert graph_type.all_element_types_keyed is True
@@ -276,127 +124,13 @@ class TestGraschFunctional:
         key_constraints = graph_type.constraints
         assert len(key_constraints) == 3
         
-        constraint_types = {c.element_type for c in key_constraints}
-        assert "Person" in constraint_types
-        assert "Company" in constraint_types
-        assert "WORKS_FOR" in constraint_types
+        assert graph_type.constraint_element_types >= {"Person", "Company", "WORKS_FOR"}
         
-        print("   ✓ ALL ELEMENT TYPES KEYED constraint validated")
-        print("   ✓ Key constraints for all element types verified")
-        print("   ✓ LEX extension syntax supported")
-
+        logger.info("   ✓ ALL ELEMENT TYPES KEYED constraint validated")
+        logger.info("   ✓ Key constraints for all element types verified")
+        logger.info("   ✓ LEX extension syntax supported")
 
-def run_functional_test():
-    """Standalone function to run the functional test"""
-    print("Grasch Library Functional Test")
-    print("=" * 40)
-    
-    # Create temporary database directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        database_path = os.path.join(temp_dir, "grasch_test.db")
-        
-        # Configure Grasch session with LEX language level and Full Profile
-        full_profile = ProfileConfiguration(
-            name="Full Profile",
-            optional_features={"GC04", "GG25", "IL001"},
-            implementation_defined={"IL001": {"min": 0, "max": None}},
-            lex_compatibility=LEXCompatibility.FULL
-        )
-        
-        session_config = SessionConfiguration(
-            profile=full_profile,
-            language_level=LanguageLevel.LEX,
-            catalog_root="file:.",
-            default_catalog_path="/",
-            nested_record_schema_processor_type="JSON Schema",
-            nested_record_schema_processor="default"
-        )
-        
-        # Initialize Grasch session
-        print(f"Initializing Grasch session with {session_config.language_level.value} language level...")
-        print(f"Using profile: {session_config.profile.name}")
-        print(f"Database path: {database_path}")
-        
-        session = GraschSession(session_config, database_path)
-        
-        # Create test instance and run
-        test_instance = TestGraschFunctional()
-        
-        # Create session for standalone mode
-        grasch_session = GraschSession(session_config, database_path)
-        
-        # Step 1: Create catalog structure
-        print("\n1. Creating catalog structure...")
-        grasch_session.create_catalog_structure()
-        
-        # Verify catalog structure
-        assert grasch_session.catalog.root.children["production"] is not None
-        assert grasch_session.catalog.root.children["development"] is not None
-        print("   ✓ Catalog directories created successfully")
-        
-        # Step 2: Define content types
-        print("\n2. Defining content record types...")
-        content_types = test_instance.create_content_types()
-        
-        # Verify content types
-        assert len(content_types) == 3
-        assert content_types["person"].name == "Person"
-        assert content_types["company"].name == "Company"
-        assert content_types["employment"].name == "WORKS_FOR"
-        assert content_types["person"].identifier == ["Person"]
-        assert content_types["company"].identifier == ["Company"]
-        assert content_types["employment"].identifier == ["WORKS_FOR"]
-        print("   ✓ Content record types with type identifiers defined")
-        
-        # Step 3: Create graph schema with constraints
-        print("\n3. Creating graph type with LEX constraints...")
-        graph_type = test_instance.create_graph_schema(content_types)
-        
-        # Verify graph type
-        assert graph_type.all_element_types_keyed is True
-        assert len(graph_type.node_types) == 2
-        assert len(graph_type.edge_types) == 1
-        assert len(graph_type.constraints) == 3
-        print("   ✓ Graph type with ALL ELEMENT TYPES KEYED constraint created")
-        
-        # Step 4: Create and populate graph
-        print("\n4. Creating and populating graph instance...")
-        graph = test_instance.create_and_populate_graph(graph_type)
-        
-        # Verify graph population
-        assert len(graph.nodes) == 4
-        assert len(graph.edges) == 2
-        assert graph.graph_type == graph_type
-        print(f"   ✓ Graph populated with {len(graph.nodes)} nodes and {len(graph.edges)} edges")
-        
-        # Step 5: Store in catalog
-        print("\n5. Storing objects in catalog...")
-        schema = grasch_session.catalog.create_gql_schema("/production/customer_data", "employee_schema")
-        schema.add_graph_type(graph_type)
-        schema.add_graph(graph)
-        
-        # Verify catalog storage
-        assert "employee_schema" in grasch_session.catalog.root.children["production"].children["customer_data"].schemas
-        stored_schema = grasch_session.catalog.root.children["production"].children["customer_data"].schemas["employee_schema"]
-        assert "EmployeeGraph" in stored_schema.graph_types
-        assert "employee_data" in stored_schema.graphs
-        print("   ✓ Objects stored in catalog at /production/customer_data/employee_schema")
-        
-        # Step 6: Demonstrate queries
-        print("\n6. Demonstrating Cypher queries...")
-        grasch_session.demonstrate_cypher_queries()
-        
-        # Step 7: Demonstrate spectral typing concepts
-        print("\n7. Demonstrating spectral typing concepts...")
-        grasch_session.demonstrate_spectral_typing()
-        
-        print("\n" + "=" * 60)
-        print("✓ FUNCTIONAL TEST COMPLETED SUCCESSFULLY!")
-        print("✓ All Grasch library features demonstrated")
-        print("✓ Graph data persisted in Kuzu database")
-        print("✓ Cypher queries executed successfully")
-        print("=" * 60)
 
 
 if __name__ == "__main__":
-    run_functional_test()
\ No newline at end of file
+    main()
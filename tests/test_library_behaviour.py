@@ -0,0 +1,469 @@
+"""
+Focused tests for Grasch library behaviour that the functional workflow does not reach.
+
+Each section covers one component, including its failure and edge cases.
+"""
+
+from __future__ import annotations
+
+import copy
+import io
+import os
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from grasch import (
+    CardinalityConstraintSpecification,
+    Catalog,
+    ContentRecordType,
+    ContentRecordTypeBuilder,
+    Directory,
+    Graph,
+    GraphType,
+    KeyConstraint,
+    LabelType,
+    LEXCompatibility,
+    ProfileConfiguration,
+    PropertyType,
+    ValidationResult,
+)
+from grasch.kuzu_mock import MockKuzuConnection
+
+from _functional_core import build_content_types, build_schema, make_session_config
+
+
+@pytest.fixture
+def graph_type() -> GraphType:
+    """Employee graph type with key constraints on Person, Company and WORKS_FOR"""
+    return build_schema(build_content_types())
+
+
+@pytest.fixture
+def graph(graph_type) -> Graph:
+    """Empty graph of the employee graph type"""
+    return Graph("employees", graph_type)
+
+
+# Compiled validator
+
+def test_validator_accepts_keyed_elements(graph_type):
+    assert graph_type.validate({"labels": ["Person"], "properties": {"name": "Alice"}})
+    assert graph_type.validate({"labels": ["WORKS_FOR"], "properties": {}})
+
+
+def test_validator_rejects_element_missing_its_key_label(graph_type):
+    graph_type.add_constraint(KeyConstraint("Person", ("Person", "name")))
+    assert not graph_type.validate({"labels": ["Person"], "properties": {}})
+    assert not graph_type.validate({"labels": ["Person"], "properties": {"name": None}})
+
+
+def test_validator_ignores_elements_of_other_types(graph_type):
+    graph_type.add_constraint(KeyConstraint("Person", ("Person", "email")))
+    assert graph_type.validate({"labels": ["Company"], "properties": {}})
+    assert graph_type.validate({})
+
+
+def test_validator_is_rebuilt_after_add_constraint(graph_type):
+    element = {"labels": ["Company"], "properties": {}}
+    assert graph_type.validate(element)
+    graph_type.add_constraint(KeyConstraint("Company", ("name",)))
+    assert not graph_type.validate(element)
+
+
+def test_constraints_cannot_be_mutated_in_place(graph_type):
+    with pytest.raises(AttributeError):
+        graph_type.constraints.append(KeyConstraint("Company", ("name",)))
+    assert len(graph_type.constraints) == 3
+
+
+def test_graph_type_with_a_compiled_validator_can_be_pickled(graph_type):
+    element = {"labels": ["Person"], "properties": {}}
+    graph_type.add_constraint(KeyConstraint("Person", ("name",)))
+    assert not graph_type.validate(element)
+    restored = pickle.loads(pickle.dumps(graph_type))
+    assert not restored.validate(element)
+    assert restored.validate({"labels": ["Person"], "properties": {"name": "A"}})
+
+
+# KeyConstraint classification
+
+def test_label_key_is_not_satisfied_by_a_property(graph_type):
+    constraint = KeyConstraint("Person", ("Person",), graph_context=graph_type)
+    assert constraint.validate({"labels": ["Person"], "properties": {}})
+    assert not constraint.validate({"labels": [], "properties": {"Person": "x"}})
+
+
+def test_property_key_is_not_satisfied_by_a_label(graph_type):
+    constraint = KeyConstraint("Person", ("name",), graph_context=graph_type)
+    assert constraint.validate({"labels": [], "properties": {"name": "A"}})
+    assert not constraint.validate({"labels": ["Person", "name"], "properties": {}})
+    assert not constraint.validate({"labels": [], "properties": {"name": None}})
+
+
+def test_key_unknown_to_the_content_type_is_satisfied_either_way(graph_type):
+    constraint = KeyConstraint("Person", ("nickname",), graph_context=graph_type)
+    assert constraint.validate({"labels": ["nickname"], "properties": {}})
+    assert constraint.validate({"labels": [], "properties": {"nickname": "Al"}})
+    assert not constraint.validate({"labels": [], "properties": {"nickname": None}})
+
+
+def test_keys_are_satisfied_either_way_without_a_content_type():
+    constraint = KeyConstraint("Unknown", ("Unknown", "name"))
+    assert constraint.validate({"labels": ["Unknown", "name"], "properties": {}})
+    assert constraint.validate({"labels": [], "properties": {"Unknown": 1, "name": "x"}})
+    assert not constraint.validate({"labels": ["Unknown"], "properties": {}})
+
+
+# Detailed checks and error messages
+
+def test_check_reports_missing_keys_in_declaration_order(graph_type):
+    constraint = KeyConstraint("Person", ("email", "Person", "name"), graph_context=graph_type)
+    assert constraint.check({"labels": [], "properties": {"name": None}}) == ValidationResult(
+        False, ("email", "Person", "name"))
+    assert constraint.check({"labels": ["Person"], "properties": {"name": "A", "email": "a@x"}}) == ValidationResult(True)
+
+
+def test_error_message_reuses_a_prior_result(graph_type):
+    constraint = KeyConstraint("Person", ("name",), graph_context=graph_type)
+    element = {"labels": ["Person"], "properties": {}}
+    result = constraint.check(element)
+    assert constraint.get_error_message(element, result) == constraint.get_error_message(element)
+    assert constraint.get_error_message(element) == "Key constraint violation on Person: missing key attributes ['name']"
+
+
+def test_validation_result_is_immutable():
+    result = ValidationResult(True)
+    assert result.missing == ()
+    with pytest.raises(AttributeError):
+        result.ok = False
+
+
+# Batch validation
+
+def test_validate_all_runs_edge_constraints_over_edge_rows(graph):
+    graph.insert_nodes([{"labels": ["Person"], "properties": {"name": "A"}}] * 3)
+    graph.insert_edge(0, 1, ["WORKS_FOR"], {"position": "Engineer"})
+    graph.insert_edge(1, 2, ["WORKS_FOR"], {})
+    assert graph.validate_all(KeyConstraint("WORKS_FOR", ("position",), graph_context=graph)) == [True, False]
+
+
+def test_validate_all_reports_elements_of_other_types_as_valid_by_id(graph):
+    graph.insert_nodes([
+        {"labels": ["Company"], "properties": {}},
+        {"labels": ["Person"], "properties": {"name": "A"}},
+        {"labels": ["Company"], "properties": {}},
+        {"labels": ["Person"], "properties": {"name": "B", "email": "b@example.com"}},
+    ])
+    graph.insert_edge(1, 0, ["WORKS_FOR"], {})
+    assert graph.validate_all(KeyConstraint("Person", ("email",), graph_context=graph)) == [True, False, True, True]
+
+
+def test_validate_all_on_an_empty_graph_returns_no_results(graph):
+    assert graph.validate_all(KeyConstraint("Person", ("name",))) == []
+
+
+@pytest.mark.parametrize("constraint", [
+    KeyConstraint("Person", ("Person",)),
+    CardinalityConstraintSpecification("WORKS_FOR", 0).create_constraint(None),
+], ids=["key", "default"])
+def test_validate_batch_rejects_columns_of_different_length(constraint):
+    with pytest.raises(ValueError):
+        constraint.validate_batch([["Person"], ["Person"]], [{}])
+
+
+# Mock Cypher connection
+
+def test_employment_query_returns_employment_rows(capsys):
+    # The person pattern is a prefix of the employment pattern; the longer match must win
+    connection = MockKuzuConnection("db")
+    rows = connection.execute("""
+        MATCH (p:Person)-[r:WORKS_FOR]->(c:Company)
+        RETURN p.name, r.position, r.start_date, c.name
+    """)
+    assert [(row["p.name"], row["r.position"], row["c.name"]) for row in rows] == [
+        ("Alice Johnson", "Engineer", "TechCorp"),
+        ("Bob Smith", "Analyst", "DataSystems"),
+    ]
+    assert "Executing Cypher query" in capsys.readouterr().out
+
+
+def test_unknown_query_returns_no_rows():
+    assert MockKuzuConnection("db").execute("MATCH (x:Unknown) RETURN x", io.StringIO()) == ()
+
+
+def test_query_echo_goes_to_the_given_stream(capsys):
+    stream = io.StringIO()
+    MockKuzuConnection("db").execute("MATCH (c:Company) RETURN c.name", stream)
+    assert stream.getvalue() == "Executing Cypher query: MATCH (c:Company) RETURN c.name\n"
+    assert capsys.readouterr().out == ""
+
+
+# Label type interning
+
+class _CustomLabel(LabelType):
+    __slots__ = ()
+
+
+@pytest.mark.parametrize("duplicate", [copy.copy, copy.deepcopy, lambda value: pickle.loads(pickle.dumps(value))],
+                         ids=["copy", "deepcopy", "pickle"])
+def test_copied_label_types_resolve_to_the_interned_instance(duplicate):
+    label_type = LabelType("Person")
+    assert duplicate(label_type) is label_type
+    assert duplicate(_CustomLabel("Person")) is _CustomLabel("Person")
+
+
+def test_label_type_subclasses_intern_their_own_instances():
+    custom = _CustomLabel("Person")
+    assert type(custom) is _CustomLabel
+    assert custom is _CustomLabel("Person")
+    assert custom is not LabelType("Person")
+    assert type(LabelType("Person")) is LabelType
+
+
+@pytest.mark.parametrize("duplicate", [copy.deepcopy, lambda value: pickle.loads(pickle.dumps(value))],
+                         ids=["deepcopy", "pickle"])
+def test_schema_objects_holding_label_types_can_be_copied(graph, duplicate):
+    graph.insert_node(["Person"], {"name": "Alice"})
+    copied = duplicate(graph)
+    assert copied.get_node(0) == graph.get_node(0)
+    assert copied.graph_type.node_types["Person"].identifying_content_type.type_key == (LabelType("Person"),)
+
+
+# Single inserts and record views
+
+def test_insert_node_returns_sequential_ids_and_stores_the_record(graph):
+    assert graph.insert_node(["Person"], {"name": "Alice"}) == 0
+    assert graph.insert_node(("Company",), {}) == 1
+    assert graph.node_count == 2
+    assert graph.get_node(0) == {"labels": ["Person"], "properties": {"name": "Alice"}, "id": 0}
+    assert graph.get_node(1) == {"labels": ["Company"], "properties": {}, "id": 1}
+
+
+def test_insert_node_copies_its_arguments(graph):
+    labels, properties = ["Person"], {"name": "Alice"}
+    graph.insert_node(labels, properties)
+    labels.append("Company")
+    properties["name"] = "Bob"
+    assert graph.get_node(0) == {"labels": ["Person"], "properties": {"name": "Alice"}, "id": 0}
+
+
+@pytest.fixture
+def filled_graph(graph) -> Graph:
+    """Graph with three Person nodes and two WORKS_FOR edges"""
+    for name in ("A", "B", "C"):
+        graph.insert_node(["Person"], {"name": name})
+    graph.insert_edge(0, 1, ["WORKS_FOR"], {})
+    graph.insert_edge(1, 2, ["WORKS_FOR"], {})
+    return graph
+
+
+def test_record_views_have_the_element_counts_as_length(filled_graph):
+    assert (len(filled_graph.nodes), len(filled_graph.edges)) == (3, 2)
+    assert len(Graph("empty", filled_graph.graph_type).nodes) == 0
+
+
+def test_record_views_index_like_a_list(filled_graph):
+    nodes, edges = filled_graph.nodes, filled_graph.edges
+    assert nodes[0] == filled_graph.get_node(0)
+    assert nodes[-1] == filled_graph.get_node(2)
+    assert nodes[-3] == filled_graph.get_node(0)
+    assert edges[-1] == filled_graph.get_edge(1)
+
+
+@pytest.mark.parametrize("index", [3, -4])
+def test_record_views_raise_index_error_out_of_range(filled_graph, index):
+    with pytest.raises(IndexError):
+        filled_graph.nodes[index]
+
+
+def test_record_views_slice_like_a_list(filled_graph):
+    records = [filled_graph.get_node(node_id) for node_id in range(3)]
+    nodes = filled_graph.nodes
+    for index in (slice(1, None), slice(None, -1), slice(None, None, -1), slice(0, 3, 2), slice(5, 9)):
+        assert nodes[index] == records[index]
+
+
+def test_record_views_iterate_and_reflect_later_inserts(filled_graph):
+    nodes = filled_graph.nodes
+    assert [node["properties"]["name"] for node in nodes] == ["A", "B", "C"]
+    filled_graph.insert_node(["Person"], {"name": "D"})
+    assert len(nodes) == 4
+    assert nodes[-1]["properties"] == {"name": "D"}
+    assert list(filled_graph.edges) == [filled_graph.get_edge(0), filled_graph.get_edge(1)]
+
+
+# Bulk edge insertion
+
+def test_insert_edges_bulk_appends_edges_and_returns_their_ids(graph):
+    graph.insert_edge(0, 1, ["WORKS_FOR"], {})
+    ids = graph.insert_edges_bulk([0, 2], [1, 3], [["WORKS_FOR"], ["WORKS_FOR"]], [{"position": "A"}, {}])
+    assert ids == range(1, 3)
+    assert graph.get_edge(2) == {"source_id": 2, "target_id": 3, "labels": ["WORKS_FOR"], "properties": {}, "id": 2}
+    assert graph.get_edge(1)["properties"] == {"position": "A"}
+
+
+def test_insert_edges_bulk_defaults_to_empty_properties(graph):
+    graph.insert_edges_bulk([0], [1], [["WORKS_FOR"]])
+    assert graph.get_edge(0)["properties"] == {}
+
+
+def test_insert_edges_bulk_with_no_edges_returns_an_empty_range(graph):
+    assert graph.insert_edges_bulk([], [], []) == range(0, 0)
+    assert graph.edge_count == 0
+
+
+def test_insert_edges_bulk_rejects_columns_of_different_length(graph):
+    with pytest.raises(ValueError):
+        graph.insert_edges_bulk([0, 1], [1], [["WORKS_FOR"], ["WORKS_FOR"]])
+    assert graph.edge_count == 0
+
+
+@pytest.mark.parametrize("target_ids", [[1, "2"], [1, 2 ** 63]], ids=["non-int", "overflow"])
+def test_insert_edges_bulk_leaves_graph_unchanged_on_bad_ids(graph, target_ids):
+    graph.insert_edge(0, 1, ["WORKS_FOR"], {})
+    with pytest.raises((TypeError, OverflowError)):
+        graph.insert_edges_bulk([0, 1], target_ids, [["WORKS_FOR"], ["WORKS_FOR"]])
+    assert graph.edge_count == 1
+    # The next edge still gets id 1 with its own endpoints, so no column kept a partial row
+    assert graph.insert_edge(4, 5, ["WORKS_FOR"], {}) == 1
+    assert (graph.get_edge(1)["source_id"], graph.get_edge(1)["target_id"]) == (4, 5)
+
+
+# ContentRecordType equality and hashing
+
+def _person_type(*property_types: PropertyType) -> ContentRecordType:
+    return ContentRecordType([LabelType("Person")], list(property_types), ["Person"])
+
+
+def test_structurally_equal_record_types_are_equal_and_hash_alike():
+    direct = _person_type(PropertyType("name", "STRING", not_null=True))
+    built = (ContentRecordTypeBuilder().add_label("Person")
+             .add_property_type(PropertyType("name", "STRING", not_null=True))
+             .add_type_name("Person").create())
+    assert direct == built
+    assert hash(direct) == hash(built)
+    assert len({direct, built}) == 1
+
+
+@pytest.mark.parametrize("other", [
+    _person_type(PropertyType("name", "STRING")),
+    _person_type(PropertyType("name", "INTEGER", not_null=True)),
+    ContentRecordType([LabelType("Person")], [PropertyType("name", "STRING", not_null=True)]),
+    ContentRecordType([LabelType("Company")], [PropertyType("name", "STRING", not_null=True)], ["Company"]),
+], ids=["nullability", "datatype", "identifier", "label"])
+def test_record_types_differing_in_any_part_are_not_equal(other):
+    assert _person_type(PropertyType("name", "STRING", not_null=True)) != other
+
+
+def test_record_type_is_not_equal_to_other_objects():
+    record_type = _person_type()
+    assert record_type != ("Person",)
+    assert record_type.__eq__(object()) is NotImplemented
+
+
+@pytest.mark.parametrize("duplicate", [copy.copy, copy.deepcopy, lambda value: pickle.loads(pickle.dumps(value))],
+                         ids=["copy", "deepcopy", "pickle"])
+def test_copied_record_types_stay_equal_and_hash_alike(duplicate):
+    record_type = _person_type(PropertyType("name", "STRING"))
+    copied = duplicate(record_type)
+    assert copied == record_type
+    assert copied in {record_type}
+
+
+def test_record_type_pickled_under_another_hash_seed_hashes_afresh():
+    script = ("import pickle, sys; from grasch import ContentRecordType, PropertyType; "
+              "sys.stdout.buffer.write(pickle.dumps(ContentRecordType([], [PropertyType('name', 'STRING')])))")
+    env = {**os.environ, "PYTHONHASHSEED": "1", "PYTHONPATH": os.pathsep.join(sys.path)}
+    payload = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, check=True).stdout
+    loaded = pickle.loads(payload)
+    fresh = ContentRecordType([], [PropertyType("name", "STRING")])
+    assert loaded == fresh
+    assert hash(loaded) == hash(fresh)
+    assert loaded in {fresh}
+
+
+# Catalog directories
+
+def test_create_directories_returns_directories_in_the_order_given():
+    catalog = Catalog("db")
+    paths = ["/b/y", "/a", "/b/x", "/a/z"]
+    directories = catalog.create_directories(paths)
+    assert [directory.path for directory in directories] == paths
+    assert sorted(catalog.root.children) == ["a", "b"]
+
+
+def test_create_directories_deduplicates_shared_and_repeated_paths():
+    catalog = Catalog("db")
+    first, again, child = catalog.create_directories(["/a/b", "a/b/", "/a/b/c"])
+    assert first is again
+    assert child is first.children["c"]
+    assert list(catalog.root.children["a"].children) == ["b"]
+
+
+def test_create_directories_handles_paths_sharing_a_shorter_prefix():
+    catalog = Catalog("db")
+    deep, shallow, sibling = catalog.create_directories(["/a/b/c", "/a", "/a/d"])
+    assert shallow.children["b"].children["c"] is deep
+    assert shallow.children["d"] is sibling
+
+
+def test_create_directories_reuses_existing_directories():
+    catalog = Catalog("db")
+    existing = catalog.create_directory("/production/data")
+    (directory,) = catalog.create_directories(["/production/data"])
+    assert directory is existing
+
+
+def test_create_directories_maps_empty_paths_to_the_root():
+    catalog = Catalog("db")
+    assert catalog.create_directories(["/", ""]) == [catalog.root, catalog.root]
+    assert catalog.create_directories([]) == []
+
+
+def test_resolve_finds_directories_created_either_way():
+    catalog = Catalog("db")
+    single = catalog.create_directory("/a/b")
+    (batch,) = catalog.create_directories(["/c/d"])
+    assert catalog.resolve("a/b/") is single
+    assert catalog.resolve("/c/d") is batch
+    assert catalog.resolve("/") is catalog.root
+
+
+def test_resolve_walks_to_directories_added_outside_the_index():
+    catalog = Catalog("db")
+    parent = catalog.create_directory("/a")
+    child = parent.children["b"] = Directory("b", "/a/b")
+    assert catalog.resolve("/a/b") is child
+    assert catalog.resolve("/a/b") is child
+
+
+def test_resolve_raises_key_error_for_missing_directories():
+    catalog = Catalog("db")
+    catalog.create_directory("/a")
+    with pytest.raises(KeyError):
+        catalog.resolve("/a/missing")
+    with pytest.raises(KeyError):
+        catalog.resolve("/missing")
+
+
+# Configuration
+
+def test_session_configurations_are_hashable_cache_keys():
+    config = make_session_config()
+    assert hash(config) == hash(make_session_config())
+    assert {config: "cached"}[make_session_config()] == "cached"
+
+
+def test_profile_freezes_its_collections():
+    features = {"GC04"}
+    implementation_defined = {"IL001": {"min": 0, "max": None}}
+    profile = ProfileConfiguration("p", features, implementation_defined, LEXCompatibility.FULL)
+    features.add("GG25")
+    implementation_defined["IL001"]["min"] = 1
+    assert profile.optional_features == frozenset({"GC04"})
+    assert profile.implementation_defined == {"IL001": {"min": 0, "max": None}}
+    with pytest.raises(TypeError):
+        profile.implementation_defined["IL001"]["min"] = 2